@@ -1,4 +1,5 @@
 import importlib  # [ADDED]
+from functools import lru_cache
 
 def _load(exchange_platform: str):  # [ADDED] 필요한 경우에만 모듈 로드
     mapping = {
@@ -134,23 +135,25 @@ async def create_exchange(exchange_platform: str, key_params=None):  # [MODIFIED
     else:
         raise ValueError(f"Unsupported exchange: {exchange_platform}")
 
+# (coin, quote) -> 거래소 심볼. coin 은 symbol_create 에서 이미 upper() 됨
+# quote 를 쓰지 않는 항목은 str.format bound method (여분 인자는 무시됨) -> lambda 프레임 없음
 SYMBOL_FORMATS = {
-    "paradex":  lambda c, q=None: f"{c}-USD-PERP",
-    "edgex":    lambda c, q=None: f"{c}USD",
-    "grvt":     lambda c, q=None: f"{c}_USDT_Perp",
-    "backpack": lambda c, q=None: f"{c}_USDC_PERP",
-    "lighter":  lambda c, q=None: c,
+    "paradex":  "{}-USD-PERP".format,
+    "edgex":    "{}USD".format,
+    "grvt":     "{}_USDT_Perp".format,
+    "backpack": "{}_USDC_PERP".format,
+    "lighter":  "{}".format,
     "treadfi.hyperliquid": lambda coin, q=None: (
         f"{coin.split(':')[0].lower()}_{coin.split(':')[1].upper()}:PERP-{q or 'USDC'}" 
         if ":" in coin 
         else f"{coin.upper()}:PERP-{q or 'USDC'}"
     ),
     "treadfi.pacifica": lambda coin, q=None: f"{coin.upper()}:PERP-{q or 'USDC'}",
-    "variational": lambda coin, q=None: coin.upper(), # same
-    "pacifica": lambda coin, q=None: coin.upper(), # same
-    "hyperliquid": lambda coin, q=None: coin.upper(), # use internal mapping
-    "superstack": lambda coin, q=None: coin.upper(), # use internal mapping
-    "standx": lambda coin, q=None: f"{coin.upper()}-USD",  # BTC-USD
+    "variational": "{}".format, # same
+    "pacifica": "{}".format, # same
+    "hyperliquid": "{}".format, # use internal mapping
+    "superstack": "{}".format, # use internal mapping
+    "standx": "{}-USD".format,  # BTC-USD
 }
 
 SPOT_SYMBOL_FORMATS = {
@@ -162,6 +165,7 @@ SPOT_SYMBOL_FORMATS = {
     "edgex": lambda c: f"{c[0]}/{c[1]}", # BTC/USDC 형태
 }
 
+@lru_cache(maxsize=256)  # 순수 함수, 같은 (거래소, coin) 조합이 반복 호출됨
 def symbol_create(exchange_platform: str, coin: str, *, is_spot=False, quote=None):
     """spot의 경우 BTC/USDC와 같은 형태, quote가 있음"""
     """perp의 경우 BTC의 형태, dex가 붙으면 xyz:XYZ100 형태, quote가 없음"""
@@ -2,7 +2,9 @@ import asyncio
 import logging
 import argparse
 import random
-from datetime import datetime
+import signal
+import sys
+import time
 import json
 from dataclasses import dataclass
 from exchange_factory import create_exchange, symbol_create
@@ -31,6 +33,7 @@ class Module:
     CLOSE_POSITION = 'close_position'
     GET_UNREALIZED_PNL = 'pnl'
     REDUCE_POSITION = 'reduce'
+    SNAPSHOT = 'snapshot' # GET_COLLATERAL + GET_POSITION 동시 실행 (내부용)
 
 ALL_MODULES = [
     Module.GET_COLLATERAL,
@@ -44,6 +47,8 @@ ALL_MODULES = [
     Module.REDUCE_POSITION
 ]
 SLEEP_BETWEEN_CALLS = 0.2
+CLOSE_TIMEOUT = 5.0 # exchange.close() 최대 대기(초)
+READ_TIMEOUT = 10.0 # 조회(collateral/position/open orders) 거래소별 최대 대기(초)
 AUTO_RUN_TIMER = [60*5, 60*10] # between 30~60min
 MAX_ORDER_SIZE = 0.13
 
@@ -51,9 +56,9 @@ MAX_ORDER_SIZE = 0.13
 coin = 'BTC'
 amount = 0.06
 exchange_configs = {
-    'backpack': {'create': False, 'side': 'short', 'need_close': False, 'key_params': BACKPACK_KEY,'multiply':2},
+    'backpack': {'create': False, 'side': 'short', 'need_close': True, 'key_params': BACKPACK_KEY,'multiply':2},
     
-    'edgex': {'create': True, 'side': 'long', 'need_close': False, 'key_params': EDGEX_KEY,'multiply':1},
+    'edgex': {'create': True, 'side': 'long', 'need_close': True, 'key_params': EDGEX_KEY,'multiply':1},
     
     'paradex': {'create': True, 'side': 'short', 'need_close': True, 'key_params': PARADEX_KEY,'multiply':1},
     
@@ -88,11 +93,18 @@ select_module_to_keys = {
 }
 # end of setting
 
+# 거래소별 심볼은 coin이 고정이므로 1회만 생성
+symbols_per_exchange = {
+    name: symbol_create(name, coin)
+    for name in exchange_configs
+}
+
 market_order_params_per_exchange = {}
 
 for k, v in exchange_configs.items():
     mul = exchange_configs[k]['multiply']
-    side = 'buy' if exchange_configs[k]['side']=='long' else 'sell'
+    # 설정 side 는 여기서 한 번만 정규화 -> 이후 경로는 'buy'/'sell' 소문자만 다룸
+    side = 'buy' if str(exchange_configs[k]['side']).lower()=='long' else 'sell'
     market_order_params_per_exchange[k] = {'side':side,'amount': round(amount*mul,3)}
 
 limit_order_params = [
@@ -109,8 +121,18 @@ def log_volume(exchange: str, coin: str, amount: float, is_coll_volume: bool = F
     if is_coll_volume:
         update_volume_summary(exchange, coin, amount, is_coll_volume, entry_price, unrealized_pnl)
 
+_last_minute = [None, ""] # (분 단위 키, "YYYY-MM-DD HH:MM:") 캐시
+
+def _utc_timestamp() -> str:
+    now = time.gmtime()
+    key = now[:5]
+    if _last_minute[0] != key:
+        _last_minute[0] = key
+        _last_minute[1] = f"{now.tm_year:04d}-{now.tm_mon:02d}-{now.tm_mday:02d} {now.tm_hour:02d}:{now.tm_min:02d}:"
+    return _last_minute[1] + f"{now.tm_sec:02d}"
+
 def write_log_line(exchange: str, coin: str, amount: float):
-    now = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
+    now = _utc_timestamp()
     logline = f"{now} | {exchange} | {coin} | {amount}"
     with open("volume_log.txt", "a") as f:
         f.write(logline + "\n")
@@ -138,28 +160,37 @@ def update_volume_summary(exchange: str, coin: str, amount: float, is_coll_volum
     with open("volume_summary.json", "w") as f:
         json.dump(summary, f, indent=2)
 
+_OPPOSITE_SIDE = {'buy': 'sell', 'sell': 'buy'}
+
 def reverse_side(side:str):
-    if side not in ['buy','sell']:
-        raise ValueError('side must be in buy or sell')
-    
-    return 'buy' if side == 'sell' else 'sell'
+    try:
+        return _OPPOSITE_SIDE[side]
+    except KeyError:
+        raise ValueError('side must be in buy or sell') from None
 
-async def run_batch(title, exchanges, handler_fn):
-    print(f"\n[V] {title}")
+async def gather_per_exchange(exchanges, handler_fn, timeout=None):
+    """거래소별 handler_fn 동시 실행 -> (names, results), 예외는 결과로 반환"""
     tasks, names = [], []
     for name, ex in exchanges.items():
         try:
-            tasks.append(asyncio.create_task(handler_fn(name, ex)))
+            coro = handler_fn(name, ex)
+            if timeout is not None:
+                coro = asyncio.wait_for(coro, timeout=timeout)
+            tasks.append(asyncio.create_task(coro))
             names.append(name)
         except Exception as e:
             print(f"[ERROR] {name}: {e}")
 
     results = await asyncio.gather(*tasks, return_exceptions=True)
+    return names, results
+
+def print_batch(title, names, results):
+    print(f"\n[V] {title}")
     if title == 'Check Collaterals':
         usdc = 0
     for name, result in zip(names, results):
         if isinstance(result, Exception):
-            print(f"[ERROR] {name}: {result}")
+            print(f"[ERROR] {name}: {str(result) or type(result).__name__}")
         else:
             if title == 'Check Positions':
                 try:
@@ -176,9 +207,52 @@ async def run_batch(title, exchanges, handler_fn):
                     except Exception as e:
                         pass
                     print(f"sum: {usdc}")
-                
+
+async def run_batch(title, exchanges, handler_fn, timeout=None):
+    """
+    거래소별 handler_fn 동시 실행.
+    timeout: 거래소별 최대 대기 (조회 전용 batch 에만 사용, 주문 batch 는 중간 취소되면 안 되므로 None)
+    """
+    names, results = await gather_per_exchange(exchanges, handler_fn, timeout)
+    # 결과와 함께 출력 (여러 batch 동시 실행 시 섞이지 않도록)
+    print_batch(title, names, results)
     return dict(zip(names, results))
 
+async def get_pos(n, e):
+    symbol = symbols_per_exchange[n]
+    return await e.get_position(symbol)
+
+async def refresh_snapshot(exchanges):
+    """거래소별 get_snapshot 1회로 collateral + position 조회, positions 반환"""
+    # timeout 은 조회별로 적용 (한쪽이 느려도 다른 쪽 결과는 유지)
+    names, results = await gather_per_exchange(
+        exchanges, lambda n, e: e.get_snapshot(symbols_per_exchange[n], timeout=READ_TIMEOUT)
+    )
+    collaterals = [r if isinstance(r, Exception) else r[0] for r in results]
+    positions = [r if isinstance(r, Exception) else r[1] for r in results]
+    print_batch("Check Collaterals", names, collaterals)
+    print_batch("Check Positions", names, positions)
+    return dict(zip(names, positions))
+
+def merge_snapshot_steps(keys):
+    """연속된 GET_COLLATERAL -> GET_POSITION 을 SNAPSHOT 한 단계로 합침"""
+    merged = []
+    for key in keys:
+        if key == Module.GET_POSITION and merged and merged[-1] == Module.GET_COLLATERAL:
+            merged[-1] = Module.SNAPSHOT
+        else:
+            merged.append(key)
+    return merged
+
+def _as_float(value, default=0.0) -> float:
+    """position 필드(size/entry_price/pnl) -> float, None/파싱 실패 시 default"""
+    if value is None:
+        return default
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
 def select_next_module(positions):
     module_list = ['order_auto','reduce_auto']
     next_module = random.choice(module_list)
@@ -187,6 +261,10 @@ def select_next_module(positions):
     for name, v in positions.items():
         if v == None:
             return next_module
+        if not isinstance(v, dict):
+            # 조회 실패(예외/timeout) -> 포지션을 모르므로 주문하지 않고 다시 조회만
+            print(f'{name}: position unknown ({v!r}), skip trading this round')
+            return 'check_auto'
         
         eparam = market_order_params_per_exchange[name]
         
@@ -194,14 +272,15 @@ def select_next_module(positions):
         order_amount = eparam['amount']
         
         curr_side = v['side']
-        curr_size = v['size']
+        curr_size = _as_float(v.get('size'))
         
-        next_amount = float(curr_size) if curr_side == 'long' else -float(curr_size)
+        next_amount = curr_size if curr_side == 'long' else -curr_size
+        # +- real value (order 방향 기준)
+        signed_amount = float(order_amount) if order_side == 'buy' else -float(order_amount)
         if next_module == 'order_auto':
-            # +- real value
-            next_amount += float(order_amount) if order_side == 'buy' else -float(order_amount)
+            next_amount += signed_amount
         elif next_module == 'reduce_auto':
-            next_amount += -float(order_amount) if order_side == 'buy' else +float(order_amount)
+            next_amount -= signed_amount
         
         next_amount = round(next_amount,3)
         #print("#####")
@@ -216,15 +295,46 @@ def select_next_module(positions):
     return next_module
     
 
+def install_stop_handler() -> asyncio.Event:
+    """SIGINT/SIGTERM -> stop_event set (auto 모드 대기 중 즉시 종료)
+
+    첫 signal 에서 handler 를 해제 -> 주문/생성 중에 멈춰 있으면 두 번째 Ctrl+C 는 기본 동작(KeyboardInterrupt)
+    """
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    sigs = (signal.SIGINT, signal.SIGTERM)
+
+    def on_signal():
+        stop_event.set()
+        for s in sigs:
+            loop.remove_signal_handler(s)
+
+    for sig in sigs:
+        try:
+            loop.add_signal_handler(sig, on_signal)
+        except (NotImplementedError, RuntimeError):
+            pass  # Windows: 기본 KeyboardInterrupt 동작 유지
+    return stop_event
+
+async def sleep_or_stop(stop_event: asyncio.Event, seconds: float) -> bool:
+    """seconds 동안 대기, 도중에 stop 되면 바로 True 반환"""
+    try:
+        await asyncio.wait_for(stop_event.wait(), timeout=seconds)
+        return True
+    except asyncio.TimeoutError:
+        return False
+
 async def main():
     positions = None
     run_forever = False
     if args.module == 'auto':
         print(args.module)
         run_forever = True
+    # auto 모드에서만 signal을 가로챔 (단발 실행은 Ctrl+C 기본 동작)
+    stop_event = install_stop_handler() if run_forever else asyncio.Event()
     
     run_cnt = 0
-    while True:
+    while not stop_event.is_set():
         run_cnt += 1
         
         if run_forever:
@@ -238,7 +348,8 @@ async def main():
                 if run_cnt >= 3:
                     random_sleep_time = round(random.uniform(AUTO_RUN_TIMER[0], AUTO_RUN_TIMER[1]),1)
                     print('will sleep',random_sleep_time)
-                    await asyncio.sleep(random_sleep_time)
+                    if await sleep_or_stop(stop_event, random_sleep_time):
+                        break
                     
             #print('autorun',module_select)
             selected_keys = select_module_to_keys.get(module_select, select_module_to_keys["get_collateral"])
@@ -250,22 +361,28 @@ async def main():
         #if module_select == 'order' or module_select == 'reduce':
         #    continue
         
-        exchanges = {
-            name: await create_exchange(name, key_params=cfg['key_params'])
-            for name, cfg in exchange_configs.items() if cfg['create']
-        }
+        # 거래소별 init(load markets 등)은 서로 독립 -> 동시에 생성
+        names = [name for name, cfg in exchange_configs.items() if cfg['create']]
+        created = await asyncio.gather(*[
+            create_exchange(name, key_params=exchange_configs[name]['key_params'])
+            for name in names
+        ])
+        exchanges = dict(zip(names, created))
 
         open_orders = {}
         positions = {}
 
-        for key in selected_keys:
-            if key == Module.GET_COLLATERAL:
-                await run_batch("Check Collaterals", exchanges, lambda n, e: e.get_collateral())
+        for key in merge_snapshot_steps(selected_keys):
+            if key == Module.SNAPSHOT:
+                positions = await refresh_snapshot(exchanges)
+
+            elif key == Module.GET_COLLATERAL:
+                await run_batch("Check Collaterals", exchanges, lambda n, e: e.get_collateral(), READ_TIMEOUT)
 
             elif key == Module.CREATE_ORDER_LIMIT:
                 print('\n[V] Create Limit Orders (per exchange)')
                 async def limit_order_handler(name, ex):
-                    symbol = symbol_create(name, coin)
+                    symbol = symbols_per_exchange[name]
                     results = []
                     for param in limit_order_params_per_exchange.get(name, []):
                         print(' *limit order', name, param["side"], param["amount"], param['price'])
@@ -276,21 +393,24 @@ async def main():
 
             elif key == Module.GET_OPEN_ORDERS:
                 async def get_orders(n, e):
-                    symbol = symbol_create(n, coin)
+                    symbol = symbols_per_exchange[n]
                     return await e.get_open_orders(symbol)
-                open_orders = await run_batch("Check Open Orders", exchanges, get_orders)
+                open_orders = await run_batch("Check Open Orders", exchanges, get_orders, READ_TIMEOUT)
 
             elif key == Module.CANCEL_ORDERS:
                 async def cancel(n, e):
-                    symbol = symbol_create(n, coin)
+                    symbol = symbols_per_exchange[n]
                     orders = open_orders.get(n)
+                    if orders is not None and not isinstance(orders, list):
+                        # 조회 실패(예외/timeout) 결과는 넘기지 않음 -> None 이면 거래소가 전체 취소
+                        orders = None
                     return await e.cancel_orders(symbol, orders)
                 await run_batch("Cancel Orders", exchanges, cancel)
 
             elif key == Module.CREATE_ORDER_MARKET or key == Module.REDUCE_POSITION:
                 print('\n[V] Create Market Orders (per exchange)')
                 async def market_order_handler(name, ex):
-                    symbol = symbol_create(name, coin)
+                    symbol = symbols_per_exchange[name]
                     results = []
                     
                     param = market_order_params_per_exchange.get(name, {})
@@ -303,19 +423,19 @@ async def main():
                 await run_batch("Create Market Orders", exchanges, market_order_handler)
 
             elif key == Module.GET_POSITION:
-                async def get_pos(n, e):
-                    symbol = symbol_create(n, coin)
-                    return await e.get_position(symbol)
-                positions = await run_batch("Check Positions", exchanges, get_pos)
+                positions = await run_batch("Check Positions", exchanges, get_pos, READ_TIMEOUT)
                 
 
             elif key == Module.CLOSE_POSITION:
                 async def close_pos(n, e):
-                    symbol = symbol_create(n, coin)
+                    symbol = symbols_per_exchange[n]
                     pos = positions.get(n)
+                    if pos is not None and not isinstance(pos, dict):
+                        # 조회 실패(예외/timeout) 결과는 넘기지 않음 -> close_position 이 직접 재조회
+                        pos = None
                     res = await e.close_position(symbol, pos)
                     if pos and res:  # 또는 res가 성공 조건일 경우 판단
-                        log_volume(n,coin,float(pos.get("size",0)),True,float(pos.get("entry_price",0)),float(pos.get("unrealized_pnl",0)))
+                        log_volume(n,coin,_as_float(pos.get("size")),True,_as_float(pos.get("entry_price")),_as_float(pos.get("unrealized_pnl")))
                     return res
                 await run_batch("Close Positions", exchanges, close_pos)
             
@@ -323,25 +443,43 @@ async def main():
                 unrealized_pnl = 0
                 for n in positions:
                     pos = positions[n]
-                    if pos is not None:
-                        unrealized_pnl += float(pos.get("unrealized_pnl",0))
+                    if isinstance(pos, dict): # 조회 실패(예외/timeout)는 건너뜀
+                        unrealized_pnl += _as_float(pos.get("unrealized_pnl"))
 
                 print('Unrealized PNL = ', round(unrealized_pnl,2))
             
             await asyncio.sleep(SLEEP_BETWEEN_CALLS)
 
-        for name, ex in exchanges.items():
-            if exchange_configs[name]['need_close']:
-                await ex.close()
+        # 종료는 거래소별로 동시에, 느린 close 하나가 전체를 붙잡지 않도록 timeout
+        await asyncio.gather(*[
+            asyncio.wait_for(ex.close(), timeout=CLOSE_TIMEOUT)
+            for name, ex in exchanges.items() if exchange_configs[name]['need_close']
+        ], return_exceptions=True)
         
         if run_forever == False:
             break
         print('run complete', run_cnt)
         print('')
-        await asyncio.sleep(2)
+        if await sleep_or_stop(stop_event, 2):
+            break
+
+def install_fast_event_loop():
+    """
+    uvloop(Linux/macOS) / winloop(Windows)이 설치되어 있으면 사용, 없으면 기본 asyncio 루프 유지.
+    Windows 기본(Proactor) 루프는 그대로 둠 - Selector 정책으로 바꾸지 않음.
+    """
+    try:
+        if sys.platform == "win32":
+            import winloop as fast_loop
+        else:
+            import uvloop as fast_loop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(fast_loop.EventLoopPolicy())
 
 if __name__ == "__main__":
         if args.module:  # 🔸 명령이 있을 때만 실행
+            install_fast_event_loop()
             asyncio.run(main())
         else:
             print('--module {명령어} 를 입력하세요')
\ No newline at end of file
@@ -2,6 +2,11 @@ from typing import Optional, Dict, Any
 from decimal import Decimal, ROUND_HALF_UP, ROUND_UP, ROUND_DOWN
 import aiohttp
 import asyncio
+import random
+import struct
+from functools import lru_cache
+
+from .fast_json import json_loads
 
 BASE_URL = "https://api.hyperliquid.xyz"
 STABLES = ["USDC","USDT0","USDH","USDE"]
@@ -11,6 +16,12 @@ STABLES_DISPLAY = ["USDC","USDT","USDH","USDE"]
 _RETRY_MAX_ATTEMPTS = 5
 _RETRY_BASE_DELAY = 1.0  # 초
 _RETRY_MAX_DELAY = 30.0  # 초
+_REQUEST_TIMEOUT = 10.0  # 초, 시도 1회당 (멈춘 연결이 무한 대기하지 않도록)
+
+
+def _jittered(delay: float, max_delay: float) -> float:
+    """delay ~ delay*1.5 사이 무작위 (여러 클라이언트가 동시에 재시도하지 않도록)"""
+    return min(max_delay, delay + random.uniform(0, delay * 0.5))
 
 
 async def _post_with_retry(
@@ -21,17 +32,19 @@ async def _post_with_retry(
     max_attempts: int = _RETRY_MAX_ATTEMPTS,
     base_delay: float = _RETRY_BASE_DELAY,
     max_delay: float = _RETRY_MAX_DELAY,
+    timeout: float = _REQUEST_TIMEOUT,
 ) -> tuple[int, Any]:
     """
-    POST 요청을 429 에러 시 지수 백오프로 재시도.
+    POST 요청을 429 / 네트워크 에러 / timeout 시 지수 백오프(+jitter)로 재시도.
     반환: (status_code, json_response or None)
     """
     headers = {"Content-Type": "application/json"}
     delay = base_delay
+    req_timeout = aiohttp.ClientTimeout(total=timeout)
 
     for attempt in range(max_attempts):
         try:
-            async with session.post(url, json=payload, headers=headers) as r:
+            async with session.post(url, json=payload, headers=headers, timeout=req_timeout) as r:
                 status = r.status
 
                 if status == 429:
@@ -43,7 +56,7 @@ async def _post_with_retry(
                         except ValueError:
                             wait_time = delay
                     else:
-                        wait_time = delay
+                        wait_time = _jittered(delay, max_delay)
 
                     wait_time = min(wait_time, max_delay)
                     print(f"[HL] 429 Too Many Requests, retry {attempt + 1}/{max_attempts} in {wait_time:.1f}s...")
@@ -53,14 +66,15 @@ async def _post_with_retry(
 
                 # 성공 또는 다른 에러
                 try:
-                    resp = await r.json()
+                    resp = await r.json(loads=json_loads)
                 except aiohttp.ContentTypeError:
                     resp = None
                 return status, resp
 
-        except aiohttp.ClientError as e:
-            print(f"[HL] Request error: {e}, retry {attempt + 1}/{max_attempts} in {delay:.1f}s...")
-            await asyncio.sleep(delay)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            wait_time = _jittered(delay, max_delay)
+            print(f"[HL] Request error: {type(e).__name__} {e}, retry {attempt + 1}/{max_attempts} in {wait_time:.1f}s...")
+            await asyncio.sleep(wait_time)
             delay = min(max_delay, delay * 2)
             continue
 
@@ -100,34 +114,38 @@ async def init_shared_hl_cache(session: Optional[aiohttp.ClientSession] = None,
 
         own_session = False
         if session is None:
-            session = aiohttp.ClientSession()
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(ttl_dns_cache=300, enable_cleanup_closed=True)
+            )
             own_session = True
 
         try:
-            # 1) dex_list
-            _HL_SHARED_CACHE["dex_list"] = await get_dex_list(session) or ["hl"]
-
-            # 2) spot meta
-            await init_spot_token_map(
-                session,
-                _HL_SHARED_CACHE["spot_index_to_name"],
-                _HL_SHARED_CACHE["spot_name_to_index"],
-                _HL_SHARED_CACHE["spot_asset_index_to_pair"],
-                _HL_SHARED_CACHE["spot_asset_index_to_bq"],
-                _HL_SHARED_CACHE["spot_token_sz_decimals"],
+            # dex_list / spot meta / perp meta 는 서로 독립 -> 동시 요청 (3×RTT -> 1×RTT)
+            dex_list, _, _ = await asyncio.gather(
+                # 1) dex_list
+                get_dex_list(session),
+                # 2) spot meta
+                init_spot_token_map(
+                    session,
+                    _HL_SHARED_CACHE["spot_index_to_name"],
+                    _HL_SHARED_CACHE["spot_name_to_index"],
+                    _HL_SHARED_CACHE["spot_asset_index_to_pair"],
+                    _HL_SHARED_CACHE["spot_asset_index_to_bq"],
+                    _HL_SHARED_CACHE["spot_token_sz_decimals"],
+                ),
+                # 3) perp meta
+                init_perp_meta_cache(
+                    session,
+                    _HL_SHARED_CACHE["perp_metas_raw"],
+                    _HL_SHARED_CACHE["perp_asset_map"],
+                ),
             )
+            _HL_SHARED_CACHE["dex_list"] = dex_list or ["hl"]
             # reverse
             _HL_SHARED_CACHE["spot_asset_pair_to_index"] = {
                 v: k for k, v in _HL_SHARED_CACHE["spot_asset_index_to_pair"].items()
             }
 
-            # 3) perp meta
-            await init_perp_meta_cache(
-                session,
-                _HL_SHARED_CACHE["perp_metas_raw"],
-                _HL_SHARED_CACHE["perp_asset_map"],
-            )
-
             _HL_SHARED_CACHE["inited"] = True
             
         finally:
@@ -160,15 +178,40 @@ def parse_hip3_symbol(sym: str) -> tuple[Optional[str], str]:
         return dex.lower().strip(), f"{dex.lower().strip()}:{coin.upper().strip()}"
     return None, s.upper().strip()
 
+# quantize 기준값 캐시: _QUANT[d] == Decimal("1e-d") (d=0 → 1). 호출마다 문자열 생성+Decimal 파싱 방지
+_QUANT = [Decimal(1)] + [Decimal(10) ** -i for i in range(1, 19)]
+
+def _quantizer(decimals: int) -> Decimal:
+    d = int(decimals)
+    if d <= 0:
+        return _QUANT[0]
+    if d < len(_QUANT):
+        return _QUANT[d]
+    return Decimal(10) ** -d
+
 def round_to_tick(value: float, decimals: int, up: bool) -> Decimal:
-    q = Decimal(f"1e-{decimals}") if decimals > 0 else Decimal("1")
+    q = _quantizer(decimals)
     d = Decimal(str(value))
     return d.quantize(q, rounding=(ROUND_UP if up else ROUND_DOWN))
 
+# format_price / format_size 결과 캐시: 시세가 반복되는 구간에서 Decimal 파이프라인 생략.
+# key 는 float 의 IEEE754 bit pattern (-0.0/0.0, NaN 을 구분) + 자릿수
+_pack_double = struct.Struct("<d").pack
+_unpack_double = struct.Struct("<d").unpack
+
 def format_price(px: float, tick_decimals: int) -> str:
+    if type(px) is float:
+        return _format_price_cached(_pack_double(px), int(tick_decimals))
+    return _format_price(px, tick_decimals)
+
+@lru_cache(maxsize=65536)
+def _format_price_cached(px_bits: bytes, tick_decimals: int) -> str:
+    return _format_price(_unpack_double(px_bits)[0], tick_decimals)
+
+def _format_price(px: float, tick_decimals: int) -> str:
     d = Decimal(str(px))
     # 1) tick에 맞게 반올림
-    q = Decimal(f"1e-{max(0,int(tick_decimals))}") if int(tick_decimals) > 0 else Decimal("1")
+    q = _quantizer(tick_decimals)
     d = d.quantize(q, rounding=ROUND_HALF_UP)
     s = format(d, "f")
     if "." not in s:
@@ -185,14 +228,23 @@ def format_price(px: float, tick_decimals: int) -> str:
     # 2) 유효숫자 5로 축소(소수 자리만 줄임). 여기서도 tick보다 '더 굵은' 자리로만 줄여서 tick 배수 성질은 유지됨.
     allow_frac = max(0, 5 - int_digits)
     allow_frac = min(allow_frac, max(0,int(tick_decimals)))
-    q2 = Decimal(f"1e-{allow_frac}") if allow_frac > 0 else Decimal("1")
+    q2 = _quantizer(allow_frac)
     d2 = d.quantize(q2, rounding=ROUND_HALF_UP)
     s2 = format(d2, "f")
     return _strip_decimal_trailing_zeros(s2)
 
 def format_size(amount: float, sz_dec: int) -> str:
+    if type(amount) is float:
+        return _format_size_cached(_pack_double(amount), int(sz_dec))
+    return _format_size(amount, sz_dec)
+
+@lru_cache(maxsize=65536)
+def _format_size_cached(amount_bits: bytes, sz_dec: int) -> str:
+    return _format_size(_unpack_double(amount_bits)[0], sz_dec)
+
+def _format_size(amount: float, sz_dec: int) -> str:
     if int(sz_dec) > 0:
-        q = Decimal(f"1e-{int(sz_dec)}")
+        q = _quantizer(sz_dec)
         sz_d = Decimal(str(amount)).quantize(q, rounding=ROUND_HALF_UP)
     else:
         sz_d = Decimal(int(round(amount)))
@@ -426,6 +478,44 @@ async def init_spot_token_map(s: aiohttp.ClientSession,
 
     return True
 
+def _coerce_int(x, default: int = 0) -> int:
+    """meta 숫자 필드 -> int. 없음/0/False 또는 정수로 못 바꾸면 default (예외 없이)"""
+    if not x:
+        return default
+    if isinstance(x, (int, float)):
+        return int(x)
+    if isinstance(x, str) and x.lstrip("-").isdigit():
+        return int(x)
+    return default
+
+def _iter_perp_assets(perp_metas_raw: list):
+    """allPerpMetas -> (key, (asset_id, szd, max_lev, isolated, collateral_token_id, original_name))"""
+    for meta_idx, meta in enumerate(perp_metas_raw):
+        uni = (meta or {}).get("universe") or []
+        collateral_token_id = (meta or {}).get("collateralToken") or 0
+        # 메인(HL): key='BTC', asset_id=local_idx / HIP-3: key='dex:COIN'(원문), asset_id=100000+meta_idx*10000+local_idx
+        base_id = 0 if meta_idx == 0 else 100000 + meta_idx * 10000
+
+        for local_idx, a in enumerate(uni):
+            if not isinstance(a, dict):
+                continue
+            name = a.get("name")
+            if not isinstance(name, str) or not name:
+                continue
+            if a.get("isDelisted", False):
+                continue
+
+            key = name.upper() if meta_idx == 0 else name
+            # 오더북 구독시 case-sensitive 하므로 원본 이름 보존
+            yield key, (
+                base_id + local_idx,
+                _coerce_int(a.get("szDecimals"), 0),
+                _coerce_int(a.get("maxLeverage"), 1),
+                _coerce_int(a.get("onlyIsolated"), 0),
+                collateral_token_id,
+                name,
+            )
+
 async def init_perp_meta_cache(s: aiohttp.ClientSession,
                                perp_metas_raw: dict,
                                perp_asset_map: dict,
@@ -450,48 +540,7 @@ async def init_perp_meta_cache(s: aiohttp.ClientSession,
     
     perp_asset_map.clear()
     try:
-        for meta_idx, meta in enumerate(perp_metas_raw):
-            
-            uni = (meta or {}).get("universe") or []
-            collateral_token_id = (meta or {}).get("collateralToken") or 0
-            
-            for local_idx, a in enumerate(uni):
-                #print(meta_idx,local_idx,a)
-                if not isinstance(a, dict):
-                    continue
-                name = a.get("name")
-                if not isinstance(name, str) or not name:
-                    continue
-
-                if a.get("isDelisted", False):
-                    continue
-                
-                try:
-                    szd = int(a.get("szDecimals") or 0)
-                except Exception:
-                    szd = 0
-
-                try:
-                    max_lev = int(a.get("maxLeverage") or 1)
-                except Exception:
-                    max_lev = 1
-
-                try:
-                    isolated = int(a.get("onlyIsolated") or False)
-                except Exception:
-                    isolated = False
-                
-                if meta_idx == 0:
-                    key = name.upper()                 # 메인(HL)
-                    original_name = name               # 오더북 구독시 case-sensitive 하므로 원본 보존
-                    asset_id = int(local_idx)
-                else:
-                    key = name                         # HIP-3: 'dex:COIN'
-                    original_name = name               # HIP-3도 원본 보존
-                    asset_id = 100000 + meta_idx * 10000 + local_idx
-
-                # (asset_id, szd, max_lev, isolated, collateral_token_id, original_name)
-                perp_asset_map[key] = (asset_id, szd, max_lev, isolated, collateral_token_id, original_name)
+        perp_asset_map.update(_iter_perp_assets(perp_metas_raw))
     except Exception as e:
         print(e)
 
@@ -0,0 +1,17 @@
+"""
+JSON 파싱 헬퍼: orjson 이 설치되어 있으면 사용, 없으면 표준 json (선택적 의존성).
+
+사용법:
+    from mpdex.utils.fast_json import json_loads
+    data = await resp.json(loads=json_loads)   # aiohttp
+    data = json_loads(raw)                     # str / bytes
+"""
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson.JSONDecodeError 는 json.JSONDecodeError 의 subclass → 기존 except 그대로 동작
+json_loads = orjson.loads if orjson is not None else json.loads
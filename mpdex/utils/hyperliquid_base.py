@@ -4,6 +4,7 @@ Hyperliquid 계열 거래소 공통 베이스.
 - 서명/payload 생성만 서브클래스에서 오버라이드
 """
 from multi_perp_dex import MultiPerpDex, MultiPerpDexMixin
+from .fast_json import json_loads
 from .common_hyperliquid import (
     parse_hip3_symbol,
     round_to_tick,
@@ -183,9 +184,10 @@ class HyperliquidBase(MultiPerpDexMixin, MultiPerpDex):
             return None
 
     def _session(self) -> aiohttp.ClientSession:
+        # 요청마다 소켓을 닫지 않고 keep-alive 연결 재사용 (정리는 close() 에서)
         if self._http is None or self._http.closed:
             self._http = aiohttp.ClientSession(
-                connector=TCPConnector(force_close=True, enable_cleanup_closed=True)
+                connector=TCPConnector(ttl_dns_cache=300, enable_cleanup_closed=True)
             )
         return self._http
 
@@ -198,6 +200,7 @@ class HyperliquidBase(MultiPerpDexMixin, MultiPerpDex):
         """
         if self._http and not self._http.closed:
             await self._http.close()
+            await asyncio.sleep(0.25)  # keep-alive SSL 소켓이 닫힐 시간 (종료 시 경고 방지)
         if self.ws_client:
             if self._ws_pool_key:
                 # Pool에서 가져온 경우 release
@@ -536,7 +539,7 @@ class HyperliquidBase(MultiPerpDexMixin, MultiPerpDex):
             payload = {"type": "clearinghouseState", "user": address, "dex": dex_param}
             try:
                 async with s.post(f"{self.http_base}/info", json=payload, headers={"Content-Type": "application/json"}) as r:
-                    data = await r.json()
+                    data = await r.json(loads=json_loads)
             except Exception:
                 continue
             for ap in (data or {}).get("assetPositions", []):
@@ -616,7 +619,7 @@ class HyperliquidBase(MultiPerpDexMixin, MultiPerpDex):
         """
         REST 기반 담보 조회:
         - Perp: clearinghouseState를 dex별로 병렬 호출 후 합산
-        - Spot: spotClearinghouseState에서 STABLES 추출
+        - Spot: spotClearinghouseState에서 STABLES 추출 (perp 호출과 동시에 진행)
         """
         address = self.vault_address or self.wallet_address
         if not address:
@@ -641,7 +644,7 @@ class HyperliquidBase(MultiPerpDexMixin, MultiPerpDex):
             payload = {"type": "clearinghouseState", "user": address, "dex": _dex_param(dex_name)}
             try:
                 async with s.post(url, json=payload, headers=headers) as r:
-                    data = await r.json()
+                    data = await r.json(loads=json_loads)
             except Exception:
                 return (0.0, 0.0)
             try:
@@ -655,38 +658,42 @@ class HyperliquidBase(MultiPerpDexMixin, MultiPerpDex):
                 wd = 0.0
             return (av, wd)
 
-        # 병렬 호출
-        perp_results = await asyncio.gather(*[_fetch_ch(d) for d in dex_order], return_exceptions=False)
+        # ---------------- Spot: spotClearinghouseState ----------------
+        async def _fetch_spot() -> dict:
+            spot_map = {d: 0.0 for d in STABLES_DISPLAY}
+            try:
+                payload_spot = {"type": "spotClearinghouseState", "user": address}
+                async with s.post(url, json=payload_spot, headers=headers) as r:
+                    spot_resp = await r.json(loads=json_loads)
+                balances_list = (spot_resp or {}).get("balances") or []
+                balances = {}
+                for b in balances_list:
+                    if not isinstance(b, dict):
+                        continue
+                    name = str(b.get("coin") or b.get("tokenName") or b.get("token") or "").upper()
+                    try:
+                        total = float(b.get("total") or 0.0)
+                    except Exception:
+                        continue
+                    if name:
+                        balances[name] = total
+
+                for onchain, disp in zip(STABLES, STABLES_DISPLAY):
+                    spot_map[disp] = float(balances.get(onchain, 0.0))
+            except Exception:
+                pass
+            return spot_map
+
+        # perp(dex별) + spot 동시 호출
+        *perp_results, spot_map = await asyncio.gather(
+            *[_fetch_ch(d) for d in dex_order], _fetch_spot(), return_exceptions=False
+        )
         av_sum = sum(av for av, _ in perp_results)
         wd_sum = sum(wd for _, wd in perp_results)
 
         total_collateral = av_sum if av_sum != 0.0 else None
         available_collateral = wd_sum if wd_sum != 0.0 else None
 
-        # ---------------- Spot: spotClearinghouseState ----------------
-        spot_map = {d: 0.0 for d in STABLES_DISPLAY}
-        try:
-            payload_spot = {"type": "spotClearinghouseState", "user": address}
-            async with s.post(url, json=payload_spot, headers=headers) as r:
-                spot_resp = await r.json()
-            balances_list = (spot_resp or {}).get("balances") or []
-            balances = {}
-            for b in balances_list:
-                if not isinstance(b, dict):
-                    continue
-                name = str(b.get("coin") or b.get("tokenName") or b.get("token") or "").upper()
-                try:
-                    total = float(b.get("total") or 0.0)
-                except Exception:
-                    continue
-                if name:
-                    balances[name] = total
-
-            for onchain, disp in zip(STABLES, STABLES_DISPLAY):
-                spot_map[disp] = float(balances.get(onchain, 0.0))
-        except Exception:
-            pass
-
         return {
             "available_collateral": available_collateral,
             "total_collateral": total_collateral,
@@ -760,7 +767,7 @@ class HyperliquidBase(MultiPerpDexMixin, MultiPerpDex):
         payload = {"type": "spotMetaAndAssetCtxs"} if is_spot else {"type": "metaAndAssetCtxs", **({"dex": dex} if dex else {})}
         try:
             async with s.post(f"{self.http_base}/info", json=payload, headers={"Content-Type": "application/json"}) as r:
-                resp = await r.json()
+                resp = await r.json(loads=json_loads)
         except Exception:
             return None
         if not isinstance(resp, list) or len(resp) < 2:
@@ -824,7 +831,7 @@ class HyperliquidBase(MultiPerpDexMixin, MultiPerpDex):
                     proxy=self.proxy,
                 ) as r:
                     r.raise_for_status()
-                    return await r.json()
+                    return await r.json(loads=json_loads)
             except Exception as e:
                 last_error = e
                 if attempt < max_retries - 1:
@@ -1000,7 +1007,7 @@ class HyperliquidBase(MultiPerpDexMixin, MultiPerpDex):
         s = self._session()
         try:
             async with s.post(f"{self.http_base}/info", json={"type": "openOrders", "user": address, "dex": dex}, headers={"Content-Type": "application/json"}) as r:
-                resp = await r.json()
+                resp = await r.json(loads=json_loads)
         except Exception:
             return None
         raw = resp.get("orders") if isinstance(resp, dict) else resp if isinstance(resp, list) else []
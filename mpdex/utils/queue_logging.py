@@ -0,0 +1,37 @@
+"""
+파일 로거 헬퍼: 파일 쓰기(포맷/traceback 포함)는 QueueListener 스레드에서 처리.
+
+사용법:
+    from mpdex.utils.queue_logging import create_file_logger
+    logger = create_file_logger("grvt_logger", "grvt_error.log")
+"""
+import atexit
+import logging
+import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+
+class _LazyQueueHandler(QueueHandler):
+    """QueueHandler.prepare() formats (incl. traceback) on the caller thread; defer all of it to the listener"""
+    def prepare(self, record):
+        return record
+
+
+def create_file_logger(name: str, filename: str, level=logging.ERROR) -> logging.Logger:
+    """logs/{filename} 에 기록하는 logger (이벤트 루프에서 blocking I/O 방지). 같은 name 재호출 시 handler 중복 없음"""
+    os.makedirs("logs", exist_ok=True)
+    logger = logging.getLogger(name)
+    logger.setLevel(level)
+    if not logger.handlers:
+        fh = logging.FileHandler(f"logs/{filename}")
+        fh.setLevel(level)
+        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+        fh.setFormatter(formatter)
+        log_queue = queue.SimpleQueue()
+        listener = QueueListener(log_queue, fh)
+        listener.start()
+        atexit.register(listener.stop)
+        logger.addHandler(_LazyQueueHandler(log_queue))
+    logger.propagate = False
+    return logger
@@ -1,5 +1,16 @@
+import asyncio
 from abc import ABC, abstractmethod
 
+# position side -> close order side
+_CLOSE_SIDE = {"long": "sell", "buy": "sell", "short": "buy", "sell": "buy"}
+
+def close_order_side(position_side) -> str:
+    """position side(long/short/buy/sell, 대소문자/공백 무관) -> 청산 주문 side, 알 수 없으면 ValueError"""
+    side = _CLOSE_SIDE.get(str(position_side).strip().lower())
+    if side is None:
+        raise ValueError(f"unknown position side: {position_side!r}")
+    return side
+
 class MultiPerpDex(ABC):
     def __init__(self):
         self.has_spot = False
@@ -122,12 +133,25 @@ class MultiPerpDexMixin:
 
     async def get_open_orders(self, symbol):
         return await self.exchange.fetch_open_orders(symbol)
+
+    async def get_snapshot(self, symbol, *, timeout=None):
+        """
+        (collateral, position) 을 동시에 조회해 함께 반환.
+        get_collateral / get_position 을 그대로 호출하므로 subclass override 와 WS->REST fallback 이 유지됨.
+        두 조회는 서로 독립: 한쪽이 실패(timeout 포함)하면 그 자리에 예외 객체가 들어가고 다른 쪽 결과는 그대로 반환.
+        timeout: 조회별 최대 대기 (None 이면 무제한)
+        """
+        legs = [self.get_collateral(), self.get_position(symbol)]
+        if timeout is not None:
+            legs = [asyncio.wait_for(leg, timeout=timeout) for leg in legs]
+        collateral, position = await asyncio.gather(*legs, return_exceptions=True)
+        return collateral, position
     
     async def close_position(self, symbol, position=None, *, is_reduce_only=True):
         if position is None:
             position = await self.get_position(symbol)
-        if not position:
+        if not position or position.get('side') == 'flat':
             return None
         size = position.get('size')
-        side = 'sell' if position.get('side').lower() in ['long','buy'] else 'buy'
+        side = close_order_side(position.get('side'))
         return await self.create_order(symbol, side, size, price=None, order_type='market', is_reduce_only=is_reduce_only)
\ No newline at end of file
@@ -6,8 +6,8 @@ Unified Test Script for Multi-Perp-DEX (Simple Version)
 """
 
 import sys
-import os
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parent.parent))
 
 import asyncio
 from exchange_factory import create_exchange, symbol_create
@@ -226,6 +226,12 @@ async def main():
                 try:
                     result = await exchange.create_order(symbol, 'buy', AMOUNT, price=l_price)
                     print(f"    Result: {result}")
+                    # 단일 주문 조회(REST polling fallback)가 실제 응답에서 state 를 읽는지 확인
+                    if result and hasattr(exchange, "_fetch_order_state"):
+                        state = await exchange._fetch_order_state(str(result))
+                        print(f"    Order state: {state}")
+                        if not state:
+                            print(f"    ERROR: fetch_order state not parsed -> polling falls back to open orders")
                 except NotImplementedError:
                     print(f"    -> Not implemented")
                 except Exception as e:
@@ -3,7 +3,9 @@ import time
 import uuid
 import nacl.signing
 import aiohttp
+from aiohttp import TCPConnector
 from multi_perp_dex import MultiPerpDex, MultiPerpDexMixin
+from mpdex.utils.fast_json import json_loads
 from decimal import Decimal, ROUND_DOWN
 from typing import Optional, Dict, Any
 
@@ -15,9 +17,11 @@ class BackpackExchange(MultiPerpDexMixin, MultiPerpDex):
         self.has_spot = True
         self.API_KEY = api_key #API_KEY_TRADING
         self.PRIVATE_KEY = secret_key #SECRET_TRADING
+        self._signing_key = nacl.signing.SigningKey(base64.b64decode(secret_key)) # 요청마다 재생성하지 않음
         self.BASE_URL = "https://api.backpack.exchange/api/v1"
         self.COLLATERAL_SYMBOL = 'USDC'
         self._ws_client: Optional[BackpackWSClient] = None
+        self._http: Optional[aiohttp.ClientSession] = None
         # WS support flags
         self.ws_supported = {
             "get_mark_price": True,
@@ -30,6 +34,17 @@ class BackpackExchange(MultiPerpDexMixin, MultiPerpDex):
             "update_leverage": False,
         }
 
+    def _session(self) -> aiohttp.ClientSession:
+        # 요청마다 세션을 새로 열지 않고 keep-alive 연결 재사용
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(
+                connector=TCPConnector(
+                    ttl_dns_cache=300,
+                    enable_cleanup_closed=True,   # 종료 중인 SSL 소켓 정리 보조
+                )
+            )
+        return self._http
+
     async def init(self):
         await self.update_avaiable_symbols()
         # Acquire authenticated WS client for private streams
@@ -46,29 +61,27 @@ class BackpackExchange(MultiPerpDexMixin, MultiPerpDex):
         self.available_symbols['perp'] = []
         self.available_symbols['spot'] = []
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(f"{self.BASE_URL}/markets") as resp:
-                result = await resp.json()
-                for v in result:
-                    symbol = v.get("symbol")
-                    base_symbol = v.get("baseSymbol")
-                    quote = v.get("quoteSymbol")
-                    market_type = v.get("marketType")
-                    if market_type == 'PERP':
-                        composite_symbol = f"{base_symbol}-{quote}"
-                        self.available_symbols['perp'].append(composite_symbol)
-                    else:
-                        composite_symbol = f"{base_symbol}/{quote}"
-                        self.available_symbols['spot'].append(composite_symbol)
-                        #print(v)
-                        #break
-                    #print(market_type,base_symbol,quote,symbol)
+        session = self._session()
+        async with session.get(f"{self.BASE_URL}/markets") as resp:
+            result = await resp.json(loads=json_loads)
+            for v in result:
+                symbol = v.get("symbol")
+                base_symbol = v.get("baseSymbol")
+                quote = v.get("quoteSymbol")
+                market_type = v.get("marketType")
+                if market_type == 'PERP':
+                    composite_symbol = f"{base_symbol}-{quote}"
+                    self.available_symbols['perp'].append(composite_symbol)
+                else:
+                    composite_symbol = f"{base_symbol}/{quote}"
+                    self.available_symbols['spot'].append(composite_symbol)
+                    #print(v)
+                    #break
+                #print(market_type,base_symbol,quote,symbol)
         
 
     def _generate_signature(self, instruction):
-        private_key_bytes = base64.b64decode(self.PRIVATE_KEY)
-        signing_key = nacl.signing.SigningKey(private_key_bytes)
-        signature = signing_key.sign(instruction.encode())
+        signature = self._signing_key.sign(instruction.encode())
         return base64.b64encode(signature.signature).decode()
 
     @staticmethod
@@ -143,18 +156,18 @@ class BackpackExchange(MultiPerpDexMixin, MultiPerpDex):
             "X-WINDOW": window,
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(f"{self.BASE_URL}/capital", headers=headers) as resp:
-                # 에러 응답 처리
-                if resp.status >= 400:
-                    ct = (resp.headers.get("content-type") or "").lower()
-                    if "application/json" in ct:
-                        body = await resp.json()
-                    else:
-                        body = await resp.text()
-                    raise RuntimeError(f"get_spot_balance failed: {resp.status} {body}")
+        session = self._session()
+        async with session.get(f"{self.BASE_URL}/capital", headers=headers) as resp:
+            # 에러 응답 처리
+            if resp.status >= 400:
+                ct = (resp.headers.get("content-type") or "").lower()
+                if "application/json" in ct:
+                    body = await resp.json(loads=json_loads)
+                else:
+                    body = await resp.text()
+                raise RuntimeError(f"get_spot_balance failed: {resp.status} {body}")
 
-                data = await resp.json()
+            data = await resp.json(loads=json_loads)
 
         # data: { "COIN": { "available": str, "locked": str, "staked": str }, ... }
         if not isinstance(data, dict):
@@ -233,15 +246,15 @@ class BackpackExchange(MultiPerpDexMixin, MultiPerpDex):
 
     async def get_mark_price_rest(self, symbol):
         """Get mark price via REST API"""
-        async with aiohttp.ClientSession() as session:
-            res = await self._get_mark_prices(session, symbol)
-            if isinstance(res, list):
-                # perp
-                price = res[0]['markPrice']
-            else:
-                # spot
-                price = res['lastPrice']
-            return price
+        session = self._session()
+        res = await self._get_mark_prices(session, symbol)
+        if isinstance(res, list):
+            # perp
+            price = res[0]['markPrice']
+        else:
+            # spot
+            price = res['lastPrice']
+        return price
 
     async def create_order(self, symbol, side, amount, price=None, order_type='market', *, is_reduce_only=False):
         if price != None:
@@ -253,52 +266,52 @@ class BackpackExchange(MultiPerpDexMixin, MultiPerpDex):
         
         side = 'Bid' if side.lower() == 'buy' else 'Ask'
 
-        async with aiohttp.ClientSession() as session:
-            market_info = await self._get_market_info(session, symbol)
-            tick_size = float(market_info['filters']['price']['tickSize'])
-            step_size = float(market_info['filters']['quantity']['stepSize'])
+        session = self._session()
+        market_info = await self._get_market_info(session, symbol)
+        tick_size = float(market_info['filters']['price']['tickSize'])
+        step_size = float(market_info['filters']['quantity']['stepSize'])
                        
-            step_d = self._to_decimal(step_size)
-            amount_d = self._to_decimal(amount)
-            quantity_d = (amount_d / step_d).to_integral_value(rounding=ROUND_DOWN) * step_d
-            quantity_str = self._format_number(quantity_d, step_size)
-
-            price_str = None
-            if order_type == "Limit":
-                tick_d = self._to_decimal(tick_size)
-                price_d = self._to_decimal(price)
-                price_d = (price_d / tick_d).to_integral_value(rounding=ROUND_DOWN) * tick_d
-                price_str = self._format_number(price_d, tick_size)
-
-            timestamp = str(int(time.time() * 1000))
-            window = "5000"
-            instruction_type = "orderExecute"
-            #print(quantity_str,price_str)
-            #return
-            order_data = {
-                "clientId": client_id,
-                "orderType": order_type,
-                "quantity": quantity_str,
-                "side": side,
-                "symbol": symbol
-            }
-            if order_type == "Limit":
-                order_data["price"] = price_str #self._format_number(price)
-
-            sorted_data = "&".join(f"{k}={v}" for k, v in sorted(order_data.items()))
-            signing_string = f"instruction={instruction_type}&{sorted_data}&timestamp={timestamp}&window={window}"
-            signature = self._generate_signature(signing_string)
-
-            headers = {
-                "X-API-KEY": self.API_KEY,
-                "X-SIGNATURE": signature,
-                "X-TIMESTAMP": timestamp,
-                "X-WINDOW": window,
-                "Content-Type": "application/json; charset=utf-8"
-            }
+        step_d = self._to_decimal(step_size)
+        amount_d = self._to_decimal(amount)
+        quantity_d = (amount_d / step_d).to_integral_value(rounding=ROUND_DOWN) * step_d
+        quantity_str = self._format_number(quantity_d, step_size)
+
+        price_str = None
+        if order_type == "Limit":
+            tick_d = self._to_decimal(tick_size)
+            price_d = self._to_decimal(price)
+            price_d = (price_d / tick_d).to_integral_value(rounding=ROUND_DOWN) * tick_d
+            price_str = self._format_number(price_d, tick_size)
+
+        timestamp = str(int(time.time() * 1000))
+        window = "5000"
+        instruction_type = "orderExecute"
+        #print(quantity_str,price_str)
+        #return
+        order_data = {
+            "clientId": client_id,
+            "orderType": order_type,
+            "quantity": quantity_str,
+            "side": side,
+            "symbol": symbol
+        }
+        if order_type == "Limit":
+            order_data["price"] = price_str #self._format_number(price)
+
+        sorted_data = "&".join(f"{k}={v}" for k, v in sorted(order_data.items()))
+        signing_string = f"instruction={instruction_type}&{sorted_data}&timestamp={timestamp}&window={window}"
+        signature = self._generate_signature(signing_string)
 
-            async with session.post(f"{self.BASE_URL}/order", json=order_data, headers=headers) as resp:
-                return self.parse_orders(await resp.json())
+        headers = {
+            "X-API-KEY": self.API_KEY,
+            "X-SIGNATURE": signature,
+            "X-TIMESTAMP": timestamp,
+            "X-WINDOW": window,
+            "Content-Type": "application/json; charset=utf-8"
+        }
+
+        async with session.post(f"{self.BASE_URL}/order", json=order_data, headers=headers) as resp:
+            return self.parse_orders(await resp.json(loads=json_loads))
 
     async def get_position(self, symbol):
         """Get position via WS (preferred) or REST fallback"""
@@ -326,13 +339,13 @@ class BackpackExchange(MultiPerpDexMixin, MultiPerpDex):
             "X-WINDOW": window
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(f"{self.BASE_URL}/position", headers=headers) as resp:
-                positions = await resp.json()
-                for pos in positions:
-                    if pos["symbol"] == symbol:
-                        return self.parse_position(pos)
-                return None
+        session = self._session()
+        async with session.get(f"{self.BASE_URL}/position", headers=headers) as resp:
+            positions = await resp.json(loads=json_loads)
+            for pos in positions:
+                if pos["symbol"] == symbol:
+                    return self.parse_position(pos)
+            return None
             
     def parse_position(self,position):
         if not position:
@@ -370,9 +383,9 @@ class BackpackExchange(MultiPerpDexMixin, MultiPerpDex):
             "X-WINDOW": window
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(f"{self.BASE_URL}/capital/collateral", headers=headers) as resp:
-                return self.parse_collateral(await resp.json())
+        session = self._session()
+        async with session.get(f"{self.BASE_URL}/capital/collateral", headers=headers) as resp:
+            return self.parse_collateral(await resp.json(loads=json_loads))
                 
     def parse_collateral(self,collateral):
         coll_return = {
@@ -390,14 +403,14 @@ class BackpackExchange(MultiPerpDexMixin, MultiPerpDex):
         headers = {"Content-Type": "application/json; charset=utf-8"}
         params = {"symbol": symbol}
         async with session.get(url, headers=headers, params=params) as resp:
-            return await resp.json()
+            return await resp.json(loads=json_loads)
     
     async def _get_market_info(self, session, symbol):
         url = f"{self.BASE_URL}/market"
         headers = {"Content-Type": "application/json; charset=utf-8"}
         params = {"symbol": symbol}
         async with session.get(url, headers=headers, params=params) as resp:
-            return await resp.json()
+            return await resp.json(loads=json_loads)
 
     async def close_position(self, symbol, position, *, is_reduce_only=True):
         return await super().close_position(symbol, position, is_reduce_only=is_reduce_only)
@@ -431,6 +444,9 @@ class BackpackExchange(MultiPerpDexMixin, MultiPerpDex):
         Args:
             force_close: True (default) = 연결 종료, False = 풀에 유지
         """
+        if self._http and not self._http.closed:
+            await self._http.close()
+        self._http = None
         if self._ws_client:
             await WS_POOL.release(api_key=self.API_KEY, force_close=force_close)
             self._ws_client = None
@@ -441,48 +457,48 @@ class BackpackExchange(MultiPerpDexMixin, MultiPerpDex):
 
         if open_orders is not None:
             # Cancel specific orders by ID
-            async with aiohttp.ClientSession() as session:
-                results = []
-                for open_order in open_orders:
-                    timestamp = str(int(time.time() * 1000))
-                    window = "5000"
-                    instruction_type = "orderCancel"
-                    oid = open_order.get("id")
-                    symbol = open_order.get("symbol")
-                    order_data = {"orderId": oid, "symbol": symbol}
-                    sorted_data = "&".join(f"{k}={v}" for k, v in sorted(order_data.items()))
-                    signing_string = f"instruction={instruction_type}&{sorted_data}&timestamp={timestamp}&window={window}"
-                    signature = self._generate_signature(signing_string)
-                    headers = {
-                        "X-API-KEY": self.API_KEY,
-                        "X-SIGNATURE": signature,
-                        "X-TIMESTAMP": timestamp,
-                        "X-WINDOW": window,
-                        "Content-Type": "application/json; charset=utf-8"
-                    }
-                    async with session.delete(f"{self.BASE_URL}/order", headers=headers, json=order_data) as response:
-                        results.append(self.parse_orders(await response.json()))
-                results = [d for sub in results for d in sub]
-                return results
+            session = self._session()
+            results = []
+            for open_order in open_orders:
+                timestamp = str(int(time.time() * 1000))
+                window = "5000"
+                instruction_type = "orderCancel"
+                oid = open_order.get("id")
+                symbol = open_order.get("symbol")
+                order_data = {"orderId": oid, "symbol": symbol}
+                sorted_data = "&".join(f"{k}={v}" for k, v in sorted(order_data.items()))
+                signing_string = f"instruction={instruction_type}&{sorted_data}&timestamp={timestamp}&window={window}"
+                signature = self._generate_signature(signing_string)
+                headers = {
+                    "X-API-KEY": self.API_KEY,
+                    "X-SIGNATURE": signature,
+                    "X-TIMESTAMP": timestamp,
+                    "X-WINDOW": window,
+                    "Content-Type": "application/json; charset=utf-8"
+                }
+                async with session.delete(f"{self.BASE_URL}/order", headers=headers, json=order_data) as response:
+                    results.append(self.parse_orders(await response.json(loads=json_loads)))
+            results = [d for sub in results for d in sub]
+            return results
         
         # Cancel all orders for the given symbol
-        async with aiohttp.ClientSession() as session:
-            timestamp = str(int(time.time() * 1000))
-            window = "5000"
-            instruction_type = "orderCancelAll"
-            order_data = {"symbol": symbol}
-            sorted_data = "&".join(f"{k}={v}" for k, v in sorted(order_data.items()))
-            signing_string = f"instruction={instruction_type}&{sorted_data}&timestamp={timestamp}&window={window}"
-            signature = self._generate_signature(signing_string)
-            headers = {
-                "X-API-KEY": self.API_KEY,
-                "X-SIGNATURE": signature,
-                "X-TIMESTAMP": timestamp,
-                "X-WINDOW": window,
-                "Content-Type": "application/json; charset=utf-8"
-            }
-            async with session.delete(f"{self.BASE_URL}/orders", headers=headers, json=order_data) as response:
-                return self.parse_orders(await response.json())
+        session = self._session()
+        timestamp = str(int(time.time() * 1000))
+        window = "5000"
+        instruction_type = "orderCancelAll"
+        order_data = {"symbol": symbol}
+        sorted_data = "&".join(f"{k}={v}" for k, v in sorted(order_data.items()))
+        signing_string = f"instruction={instruction_type}&{sorted_data}&timestamp={timestamp}&window={window}"
+        signature = self._generate_signature(signing_string)
+        headers = {
+            "X-API-KEY": self.API_KEY,
+            "X-SIGNATURE": signature,
+            "X-TIMESTAMP": timestamp,
+            "X-WINDOW": window,
+            "Content-Type": "application/json; charset=utf-8"
+        }
+        async with session.delete(f"{self.BASE_URL}/orders", headers=headers, json=order_data) as response:
+            return self.parse_orders(await response.json(loads=json_loads))
     
     async def get_open_orders(self, symbol):
         """Get open orders via WS (preferred) or REST fallback"""
@@ -497,28 +513,28 @@ class BackpackExchange(MultiPerpDexMixin, MultiPerpDex):
 
     async def get_open_orders_rest(self, symbol):
         """Get open orders via REST API"""
-        async with aiohttp.ClientSession() as session:
-            timestamp = str(int(time.time() * 1000))
-            window = "5000"
-            instruction_type = "orderQueryAll"
-            market_type = "PERP"  # PERP 마켓 지정
-
-            params = {
-                "marketType": market_type,
-                "symbol": symbol
-            }
-            sorted_data = "&".join(f"{k}={v}" for k, v in sorted(params.items()))
-            signing_string = f"instruction={instruction_type}&{sorted_data}&timestamp={timestamp}&window={window}"
-            signature = self._generate_signature(signing_string)
-
-            headers = {
-                "X-API-KEY": self.API_KEY,
-                "X-SIGNATURE": signature,
-                "X-TIMESTAMP": timestamp,
-                "X-WINDOW": window
-            }
+        session = self._session()
+        timestamp = str(int(time.time() * 1000))
+        window = "5000"
+        instruction_type = "orderQueryAll"
+        market_type = "PERP"  # PERP 마켓 지정
 
-            url = f"{self.BASE_URL}/orders"
+        params = {
+            "marketType": market_type,
+            "symbol": symbol
+        }
+        sorted_data = "&".join(f"{k}={v}" for k, v in sorted(params.items()))
+        signing_string = f"instruction={instruction_type}&{sorted_data}&timestamp={timestamp}&window={window}"
+        signature = self._generate_signature(signing_string)
 
-            async with session.get(url, headers=headers, params=params) as resp:
-                return self.parse_orders(await resp.json())
\ No newline at end of file
+        headers = {
+            "X-API-KEY": self.API_KEY,
+            "X-SIGNATURE": signature,
+            "X-TIMESTAMP": timestamp,
+            "X-WINDOW": window
+        }
+
+        url = f"{self.BASE_URL}/orders"
+
+        async with session.get(url, headers=headers, params=params) as resp:
+            return self.parse_orders(await resp.json(loads=json_loads))
\ No newline at end of file
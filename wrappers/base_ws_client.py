@@ -33,6 +33,8 @@ import websockets
 from websockets.client import WebSocketClientProtocol
 from websockets.exceptions import ConnectionClosed, ConnectionClosedOK, ConnectionClosedError, InvalidStatusCode
 
+from mpdex.utils.fast_json import json_loads
+
 logger = logging.getLogger(__name__)
 
 
@@ -281,7 +283,7 @@ class BaseWSClient(ABC):
     async def _recv_loop(self) -> None:
         """메시지 수신 루프"""
         import time
-        self._last_recv_time = time.time()
+        self._last_recv_time = time.monotonic()
 
         while self._running:
             if not self._ws:
@@ -294,9 +296,9 @@ class BaseWSClient(ABC):
                 else:
                     msg = await self._ws.recv()
 
-                self._last_recv_time = time.time()
+                self._last_recv_time = time.monotonic()
                 self._ping_fail_count = 0  # 메시지 수신 시 ping 실패 카운트 리셋
-                data = json.loads(msg)
+                data = json_loads(msg)
                 await self._handle_message(data)
 
             except asyncio.TimeoutError:
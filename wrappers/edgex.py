@@ -10,6 +10,7 @@ from decimal import Decimal, ROUND_HALF_UP, ROUND_DOWN
 import asyncio
 from typing import Optional, Dict, Any
 
+from mpdex.utils.fast_json import json_loads
 from wrappers.edgex_ws_client import EdgeXPublicWSClient, EdgeXPrivateWSClient
 
 class EdgexExchange(MultiPerpDexMixin, MultiPerpDex):
@@ -31,6 +32,9 @@ class EdgexExchange(MultiPerpDexMixin, MultiPerpDex):
         self.base_url_spot = 'https://spot.edgex.exchange'
         self.account_id = account_id
         self.private_key_hex = private_key.replace("0x", "")
+        # 서명에 매번 쓰이는 고정값은 한 번만 계산 (ec_mult 는 순수 파이썬 EC 곱셈이라 느림)
+        self._private_key_int = int(self.private_key_hex, 16)
+        self._public_y_hex: Optional[str] = None
 
         self.K_MODULUS = int("0800000000000010ffffffffffffffffb781126dcae7b2321e66a241adc64d2f", 16)
         self.market_info = {}  # symbol → metadata
@@ -41,7 +45,19 @@ class EdgexExchange(MultiPerpDexMixin, MultiPerpDex):
         self._public_ws: Optional[EdgeXPublicWSClient] = None
         self._private_ws: Optional[EdgeXPrivateWSClient] = None
         self._contract_id_map: Dict[str, str] = {}  # symbol -> contractId
+        self._http: Optional[aiohttp.ClientSession] = None
     
+    def _session(self) -> aiohttp.ClientSession:
+        # 요청마다 세션을 새로 열지 않고 keep-alive 연결 재사용
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    ttl_dns_cache=300,
+                    enable_cleanup_closed=True,   # 종료 중인 SSL 소켓 정리 보조
+                )
+            )
+        return self._http
+
     async def init(self):
         await self.get_meta_data()
         await self.get_meta_data(is_spot=True)
@@ -102,8 +118,7 @@ class EdgexExchange(MultiPerpDexMixin, MultiPerpDex):
         msg_hash = msg_hash % self.K_MODULUS
 
         # Sign
-        private_key_int = int(self.private_key_hex, 16)
-        r, s = sign(msg_hash, private_key_int)
+        r, s = sign(msg_hash, self._private_key_int)
 
         # SDK uses just r+s (no y coordinate)
         signature = r.to_bytes(32, "big").hex() + s.to_bytes(32, "big").hex()
@@ -142,51 +157,51 @@ class EdgexExchange(MultiPerpDexMixin, MultiPerpDex):
         else:
             url = f"{self.base_url}/api/v1/public/meta/getMetaData"
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as resp:
-                if resp.status != 200:
-                    #print(f"[get_meta_data] HTTP {resp.status}")
-                    return None
-                res = await resp.json()
+        session = self._session()
+        async with session.get(url) as resp:
+            if resp.status != 200:
+                #print(f"[get_meta_data] HTTP {resp.status}")
+                return None
+            res = await resp.json(loads=json_loads)
                 
-                data = res.get("data", {})
-                meta = data
-                if is_spot:
-                    market_list = data.get("symbolList", [])
-                else:
-                    market_list = data.get("contractList", [])
+            data = res.get("data", {})
+            meta = data
+            if is_spot:
+                market_list = data.get("symbolList", [])
+            else:
+                market_list = data.get("contractList", [])
 
-                for market in market_list:
+            for market in market_list:
                     
-                    name = market["symbolName"] if is_spot else market["contractName"]
+                name = market["symbolName"] if is_spot else market["contractName"]
                     
-                    if "TEMP" in name:
-                        continue
-
-                    if is_spot:
-                        self.market_info[name] = {
-                            "contract": market,
-                            "meta": meta,
-                            "symbolId": market["symbolId"],
-                            "tickSize": market["tickSize"],
-                            "stepSize": market["stepSize"],
-                            "minOrderSize": market["minOrderSize"],
-                            "maxOrderSize": market["maxOrderSize"],
-                            "defaultTakerFeeRate": market["takerFeeRate"],
-                        }
-                    else:
-                        self.market_info[name] = {
-                            "contract": market,
-                            "meta": meta,
-                            "contractId": market["contractId"],
-                            "tickSize": market["tickSize"],
-                            "stepSize": market["stepSize"],
-                            "minOrderSize": market["minOrderSize"],
-                            "maxOrderSize": market["maxOrderSize"],
-                            "defaultTakerFeeRate": market["defaultTakerFeeRate"],
-                        }
-
-                return market_list
+                if "TEMP" in name:
+                    continue
+
+                if is_spot:
+                    self.market_info[name] = {
+                        "contract": market,
+                        "meta": meta,
+                        "symbolId": market["symbolId"],
+                        "tickSize": market["tickSize"],
+                        "stepSize": market["stepSize"],
+                        "minOrderSize": market["minOrderSize"],
+                        "maxOrderSize": market["maxOrderSize"],
+                        "defaultTakerFeeRate": market["takerFeeRate"],
+                    }
+                else:
+                    self.market_info[name] = {
+                        "contract": market,
+                        "meta": meta,
+                        "contractId": market["contractId"],
+                        "tickSize": market["tickSize"],
+                        "stepSize": market["stepSize"],
+                        "minOrderSize": market["minOrderSize"],
+                        "maxOrderSize": market["maxOrderSize"],
+                        "defaultTakerFeeRate": market["defaultTakerFeeRate"],
+                    }
+
+            return market_list
     
     def generate_signature(self, method, path, params, timestamp=None):
         if not timestamp:
@@ -201,17 +216,23 @@ class EdgexExchange(MultiPerpDexMixin, MultiPerpDex):
         msg_hash = int.from_bytes(keccak(msg_bytes), "big")
         msg_hash = msg_hash % self.K_MODULUS # FIELD_PRIME
         
-        private_key_int = int(self.private_key_hex, 16)
-        
-        r, s = sign(msg_hash, private_key_int)
-        _, y =  ec_mult(private_key_int, EC_GEN, ALPHA, FIELD_PRIME)
-        
-        y_hex = y.to_bytes(32, "big").hex()
+        r, s = sign(msg_hash, self._private_key_int)
+        if self._public_y_hex is None:
+            _, y =  ec_mult(self._private_key_int, EC_GEN, ALPHA, FIELD_PRIME)
+            self._public_y_hex = y.to_bytes(32, "big").hex()
         
-        stark_signature = r.to_bytes(32, "big").hex() + s.to_bytes(32, "big").hex() + y_hex
+        stark_signature = r.to_bytes(32, "big").hex() + s.to_bytes(32, "big").hex() + self._public_y_hex
         
         return stark_signature, timestamp
 
+    async def _generate_signature_off_loop(self, method, path, params):
+        """
+        조회용 서명: 순수 python stark 서명(수십 ms)을 executor 에서 실행해
+        그동안 event loop 가 WS 수신 등 다른 작업을 처리할 수 있게 함
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.generate_signature, method, path, params)
+
     async def get_mark_price(self, symbol):
         # spot has no restapi endpoint, have to use ws
         is_spot = '/' in symbol
@@ -245,11 +266,11 @@ class EdgexExchange(MultiPerpDexMixin, MultiPerpDex):
         params = {"contractId": contract_id}
         oracle_url = f"{self.base_url}/api/v1/public/quote/getTicker"
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(oracle_url, params=params) as resp:
-                ticker_data = await resp.json()
-                last_price = Decimal(ticker_data["data"][0]["lastPrice"])
-                return last_price
+        session = self._session()
+        async with session.get(oracle_url, params=params) as resp:
+            ticker_data = await resp.json(loads=json_loads)
+            last_price = Decimal(ticker_data["data"][0]["lastPrice"])
+            return last_price
 
     async def get_orderbook(self, symbol, limit: int = 50) -> Optional[Dict[str, Any]]:
         """Get orderbook via WS (WS only, no REST fallback for depth)
@@ -343,10 +364,10 @@ class EdgexExchange(MultiPerpDexMixin, MultiPerpDex):
             if order_type.upper() == 'MARKET':
                 # Oracle price fetch
                 oracle_url = f"{self.base_url}/api/v1/public/quote/getTicker"
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(oracle_url, params={"contractId": contract_id}) as resp:
-                        ticker_data = await resp.json()
-                        oracle_price = Decimal(ticker_data["data"][0]["oraclePrice"])
+                session = self._session()
+                async with session.get(oracle_url, params={"contractId": contract_id}) as resp:
+                    ticker_data = await resp.json(loads=json_loads)
+                    oracle_price = Decimal(ticker_data["data"][0]["oraclePrice"])
                 if side.upper() == 'BUY':
                     price = oracle_price * Decimal("1.1")
                     price = price.quantize(tick_size, rounding=ROUND_HALF_UP)
@@ -393,8 +414,7 @@ class EdgexExchange(MultiPerpDexMixin, MultiPerpDex):
             packed_1 = (packed_1 << 17)
             h = pedersen_hash(h, packed_1)
 
-            private_key_int = int(self.private_key_hex, 16)
-            r, s = sign(h, private_key_int)
+            r, s = sign(h, self._private_key_int)
             l2_signature = r.to_bytes(32, "big").hex() + s.to_bytes(32, "big").hex()
 
             body = {
@@ -426,13 +446,13 @@ class EdgexExchange(MultiPerpDexMixin, MultiPerpDex):
                     "X-edgeX-Api-Timestamp": ts,
                     "X-edgeX-Api-Signature": signature,
                 }
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                url=url,
-                json=body,
-                headers=headers
-            ) as resp:
-                return await resp.json()
+        session = self._session()
+        async with session.post(
+            url=url,
+            json=body,
+            headers=headers
+        ) as resp:
+            return await resp.json(loads=json_loads)
 
     def parse_position(self, position_list,position_asset_list, symbol):
         contract_id = self.market_info[symbol]['contractId']
@@ -522,7 +542,7 @@ class EdgexExchange(MultiPerpDexMixin, MultiPerpDex):
             "accountId": self.account_id,
         }
 
-        signature, timestamp = self.generate_signature(method, path, params)
+        signature, timestamp = await self._generate_signature_off_loop(method, path, params)
 
         headers = {
             "X-edgeX-Api-Timestamp": timestamp,
@@ -535,22 +555,25 @@ class EdgexExchange(MultiPerpDexMixin, MultiPerpDex):
         else:
             url = f"{self.base_url}{path}"
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers) as resp:
-                if resp.status != 200:
-                    print(f"[get_position] HTTP {resp.status}")
-                    print(await resp.text())
-                    return None
-                data = await resp.json()
-                position_list = data['data']['positionList']
-                position_asset_list = data['data']['positionAssetList']
-                return self.parse_position(position_list, position_asset_list, symbol)
+        session = self._session()
+        async with session.get(url, headers=headers) as resp:
+            if resp.status != 200:
+                print(f"[get_position] HTTP {resp.status}")
+                print(await resp.text())
+                return None
+            data = await resp.json(loads=json_loads)
+            position_list = data['data']['positionList']
+            position_asset_list = data['data']['positionAssetList']
+            return self.parse_position(position_list, position_asset_list, symbol)
     
     async def close_position(self, symbol, position, *, is_reduce_only=True):
         return await super().close_position(symbol, position, is_reduce_only=is_reduce_only)
 
     async def close(self):
-        """Close WS connections"""
+        """Close WS connections and REST session"""
+        if self._http and not self._http.closed:
+            await self._http.close()
+        self._http = None
         if self._public_ws:
             await self._public_ws.close()
             self._public_ws = None
@@ -570,7 +593,7 @@ class EdgexExchange(MultiPerpDexMixin, MultiPerpDex):
             "accountId": self.account_id,
         }
 
-        signature, timestamp = self.generate_signature(method, path, params)
+        signature, timestamp = await self._generate_signature_off_loop(method, path, params)
 
         headers = {
             "X-edgeX-Api-Timestamp": timestamp,
@@ -583,15 +606,15 @@ class EdgexExchange(MultiPerpDexMixin, MultiPerpDex):
         else:
             url = f"{self.base_url}{path}"
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers) as resp:
-                if resp.status != 200:
-                    print(f"[get_collateral] HTTP {resp.status}")
-                    print(await resp.text())
-                    return None
-                data = await resp.json()
-                collateral = data['data']['collateralAssetModelList']
-                return self.parse_collateral(collateral)
+        session = self._session()
+        async with session.get(url, headers=headers) as resp:
+            if resp.status != 200:
+                print(f"[get_collateral] HTTP {resp.status}")
+                print(await resp.text())
+                return None
+            data = await resp.json(loads=json_loads)
+            collateral = data['data']['collateralAssetModelList']
+            return self.parse_collateral(collateral)
             
     def parse_collateral(self,collateral):
         for col in collateral:
@@ -645,7 +668,7 @@ class EdgexExchange(MultiPerpDexMixin, MultiPerpDex):
             "filterContractIdList": contract_id,
         }
 
-        signature, timestamp = self.generate_signature(method, path, params)
+        signature, timestamp = await self._generate_signature_off_loop(method, path, params)
 
         headers = {
             "X-edgeX-Api-Timestamp": timestamp,
@@ -655,14 +678,14 @@ class EdgexExchange(MultiPerpDexMixin, MultiPerpDex):
         query_str = "&".join(f"{k}={v}" for k, v in sorted(params.items()))
         url = f"{self.base_url}{path}?{query_str}"
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers) as resp:
-                if resp.status != 200:
-                    return []
+        session = self._session()
+        async with session.get(url, headers=headers) as resp:
+            if resp.status != 200:
+                return []
 
-                res = await resp.json()
-                orders = res.get("data", {}).get("dataList", [])
-                return self.parse_open_orders(orders)
+            res = await resp.json(loads=json_loads)
+            orders = res.get("data", {}).get("dataList", [])
+            return self.parse_open_orders(orders)
             
     def parse_open_orders(self, orders):
         if not orders:
@@ -723,14 +746,14 @@ class EdgexExchange(MultiPerpDexMixin, MultiPerpDex):
             "orderIdList": order_ids
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(f"{self.base_url}{path}", json=body, headers=headers) as resp:
-                if resp.status != 200:
-                    print(f"[cancel_orders] HTTP {resp.status}")
-                    print(await resp.text())
-                    return []
+        session = self._session()
+        async with session.post(f"{self.base_url}{path}", json=body, headers=headers) as resp:
+            if resp.status != 200:
+                print(f"[cancel_orders] HTTP {resp.status}")
+                print(await resp.text())
+                return []
 
-                res = await resp.json()
-                cancel_map = res.get("data", {}).get("cancelResultMap", {})
-                return [{"id": k, "status": v} for k, v in cancel_map.items()]
+            res = await resp.json(loads=json_loads)
+            cancel_map = res.get("data", {}).get("cancelResultMap", {})
+            return [{"id": k, "status": v} for k, v in cancel_map.items()]
 
@@ -3,25 +3,42 @@ from pysdk.grvt_ccxt_pro import GrvtCcxtPro
 from pysdk.grvt_ccxt_env import GrvtEnv
 import logging
 from pysdk.grvt_ccxt_utils import rand_uint32
-import os
 import asyncio
+import time
 from typing import Optional, Dict, Any
 
+from mpdex.utils.queue_logging import create_file_logger
+
 def create_logger(name: str, filename: str, level=logging.ERROR) -> logging.Logger:
-    os.makedirs("logs", exist_ok=True)
-    logger = logging.getLogger(name)
-    logger.setLevel(level)
-    if not logger.handlers:
-        fh = logging.FileHandler(f"logs/{filename}")
-        fh.setLevel(level)
-        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-        fh.setFormatter(formatter)
-        logger.addHandler(fh)
-    logger.propagate = False
-    return logger
+    return create_file_logger(name, filename, level)
 
 grvt_logger = create_logger("grvt_logger", "grvt_error.log")
 
+def _order_state_from_response(res) -> Optional[dict]:
+    """
+    fetch_order 응답 -> order state dict.
+    pysdk fetch_order 는 raw envelope {"result": {order...}} 를 그대로 반환하므로 result 를 먼저 꺼낸다.
+    반환: state dict (found) / {} (빈 result = not found) / None (예상 밖 응답 형태)
+    """
+    if not isinstance(res, dict) or "result" not in res:
+        return None
+    order = res.get("result") or {}
+    if not order:
+        return {}
+    state = order.get("state") if isinstance(order, dict) else None
+    return state if isinstance(state, dict) else None
+
+def _final_status(state: Optional[dict]) -> Optional[str]:
+    """_fetch_order_state 결과 -> 종료 status ('CLOSED' = not found), 아직 OPEN/PENDING 이거나 조회 실패면 None"""
+    if state is None:
+        return None
+    if not state:
+        return "CLOSED"  # not found
+    status = state.get("status", "")
+    if status in ("OPEN", "PENDING"):
+        return None
+    return status or "CLOSED"
+
 class GrvtExchange(MultiPerpDexMixin, MultiPerpDex):
     # WebSocket supported operations
     ws_supported = {
@@ -43,6 +60,13 @@ class GrvtExchange(MultiPerpDexMixin, MultiPerpDex):
         self.secret_key = secret_key
         self.use_ws = use_ws
         self._ws_client = None
+        # REST fallback polling for wait_order_closed (fast at first, then backoff)
+        self.use_backoff = True
+        self.poll_interval_min = 0.1  # 제출 직후 체결이 많으므로 짧게 시작
+        self.poll_interval = 2.0
+        self.poll_interval_max = 30.0
+        self.ws_order_recheck = 10.0  # WS 대기 중 이 간격마다 REST 단건 조회 (재연결 중 유실된 push 보완)
+        self._order_shape_warned = False
 
         self.exchange = GrvtCcxtPro(
             GrvtEnv("prod"),
@@ -87,9 +111,7 @@ class GrvtExchange(MultiPerpDexMixin, MultiPerpDex):
                         for o in parsed:
                             sym = o.get("symbol")
                             if sym:
-                                if sym not in self._ws_client._open_orders:
-                                    self._ws_client._open_orders[sym] = []
-                                self._ws_client._open_orders[sym].append(o)
+                                self._ws_client._open_orders.setdefault(sym, {})[o["id"]] = o
         except Exception as e:
             self.logger.error(f"Failed to init WS client: {e}")
             self._ws_client = None
@@ -103,7 +125,7 @@ class GrvtExchange(MultiPerpDexMixin, MultiPerpDex):
             # Subscribe if not yet
             if symbol not in self._ws_client._ticker_subs:
                 await self._ws_client.subscribe_ticker(symbol)
-                await asyncio.sleep(0.5)  # Wait for first data
+            await self._ws_client.wait_price_ready(symbol, timeout=0.5)  # returns as soon as first data arrives
 
             price = self._ws_client.get_mark_price(symbol)
             if price and self._ws_client.is_price_fresh(symbol):
@@ -116,7 +138,7 @@ class GrvtExchange(MultiPerpDexMixin, MultiPerpDex):
     
     def parse_order(self, order):
         try:
-            return order['metadata']['client_order_id']
+            return str(order['metadata']['client_order_id'])
         except Exception as e:
             print(e)
             self.logger.error(e, exc_info=True)
@@ -164,7 +186,7 @@ class GrvtExchange(MultiPerpDexMixin, MultiPerpDex):
         if self._ws_client and self._ws_client.connected:
             if symbol not in self._ws_client._book_subs:
                 await self._ws_client.subscribe_orderbook(symbol)
-                await asyncio.sleep(0.5)
+            await self._ws_client.wait_orderbook_ready(symbol, timeout=0.5)
 
             book = self._ws_client.get_orderbook(symbol)
             if book and self._ws_client.is_orderbook_fresh(symbol):
@@ -203,7 +225,7 @@ class GrvtExchange(MultiPerpDexMixin, MultiPerpDex):
             return None
 
         if len(positions) > 1:
-            self.logger.error('can not have more than 1 position', exc_info=True)
+            self.logger.error('can not have more than 1 position')
             return None
 
         if len(positions) == 0:
@@ -262,7 +284,7 @@ class GrvtExchange(MultiPerpDexMixin, MultiPerpDex):
         parsed = []
         for order in orders:
             #print(order)
-            order_id = order['order_id']
+            order_id = str(order['order_id'])
             symbol = order['legs'][0]['instrument']
             size = order['legs'][0]['size']
             price = order['legs'][0]['limit_price']
@@ -280,7 +302,107 @@ class GrvtExchange(MultiPerpDexMixin, MultiPerpDex):
         print("[grvt] get_open_orders: using REST fallback")
         orders = await super().get_open_orders(symbol)
         return self.parse_open_orders(orders)
-    
+
+    async def wait_order_closed(self, order_id, timeout: Optional[float] = None, *, symbol=None) -> Optional[str]:
+        """
+        Wait until order is filled/cancelled via WS order stream (no polling).
+        order_id: order_id or client_order_id (create_order return value)
+        Returns final status ('FILLED', 'CANCELLED', 'REJECTED'), None on timeout.
+        WS unavailable -> REST polling of the single order (final status, or 'CLOSED' if only
+        the open orders list was available).
+        WS wait is split into ws_order_recheck slices with a REST single-order check in between,
+        so a fill pushed while the WS was reconnecting is still seen (timeout=None does not hang).
+        """
+        if self._ws_client and self._ws_client.connected:
+            key = str(order_id)
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while True:
+                wait = self.ws_order_recheck
+                if deadline is not None:
+                    wait = min(wait, deadline - time.monotonic())
+                    if wait <= 0:
+                        return None
+                status = await self._ws_client.wait_order_closed(key, timeout=wait)
+                if status:
+                    return status
+                status = _final_status(await self._fetch_order_state(key))
+                if status:
+                    return status
+
+        print("[grvt] wait_order_closed: using REST polling fallback")
+        try:
+            return await asyncio.wait_for(self._poll_order_closed(order_id, symbol), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def _fetch_order_state(self, order_id: str) -> Optional[dict]:
+        """
+        Single-order query (order_id '0x...' or client_order_id).
+        Returns order state dict, {} if the order was not found, None on error / unexpected response shape.
+        """
+        try:
+            if order_id.startswith("0x"):
+                res = await self.exchange.fetch_order(id=order_id)
+            else:
+                res = await self.exchange.fetch_order(params={"client_order_id": order_id})
+        except Exception as e:
+            self.logger.error(f"fetch_order error: {e}")
+            return None
+        state = _order_state_from_response(res)
+        if state is None and not self._order_shape_warned:
+            # 응답 형태가 바뀌면 매 tick open orders 조회로 떨어지므로 1회 경고
+            self._order_shape_warned = True
+            self.logger.error(f"unexpected fetch_order response, falling back to open orders polling: {str(res)[:200]}")
+            print(f"[grvt] unexpected fetch_order response shape: {str(res)[:200]}")
+        return state
+
+    async def _poll_order_closed(self, order_id, symbol=None) -> str:
+        """
+        Poll single-order status until it leaves OPEN/PENDING.
+        First check is immediate. Delay ramps poll_interval_min * 1.7^misses (max poll_interval_max),
+        so quick fills near the touch are seen in ~100ms while long-resting orders back off.
+        misses reset when order state changes (partial fill).
+        """
+        key = str(order_id)
+        misses = 0
+        last_state = None
+        while True:
+            state = await self._fetch_order_state(key)
+            status = _final_status(state)
+            if status:
+                return status
+            if state is None:
+                # single-order query unavailable -> open orders list
+                try:
+                    orders = await super().get_open_orders(symbol)
+                except Exception as e:
+                    self.logger.error(f"wait_order_closed poll error: {e}")
+                    orders = None
+
+                if orders is not None:
+                    # ids are coerced to str here once, lookup is a dict hit
+                    by_id = {}
+                    for o in orders:
+                        by_id[str(o.get("order_id"))] = o
+                        cid = (o.get("metadata") or {}).get("client_order_id")
+                        if cid is not None:
+                            by_id[str(cid)] = o
+                    found = by_id.get(key)
+                    if found is None:
+                        return "CLOSED"
+                    state = found.get("state")
+
+            if state is not None and state != last_state:
+                last_state = state
+                misses = 0
+
+            if self.use_backoff:
+                delay = min(self.poll_interval_min * (1.7 ** misses), self.poll_interval_max)
+                misses += 1
+            else:
+                delay = self.poll_interval
+            await asyncio.sleep(delay)
+
     async def cancel_orders(self, symbol, open_orders=None):
         # Try WS first (faster)
         if self._ws_client and self._ws_client.connected:
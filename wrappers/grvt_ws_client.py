@@ -17,31 +17,25 @@ Usage:
     price = client.get_mark_price("BTC_USDT_Perp")
     orderbook = client.get_orderbook("BTC_USDT_Perp")
     position = client.get_position("BTC_USDT_Perp")
+
+    # Wait for order fill/cancel (pushed by order stream)
+    status = await client.wait_order_closed(order_id, timeout=30)
 """
 
 import asyncio
 import logging
-import os
 import time
-from typing import Dict, Optional, Any, Callable
+from typing import Dict, Optional, Any, Callable, Set
 
 from pysdk.grvt_ccxt_ws import GrvtCcxtWS
 from pysdk.grvt_ccxt_env import GrvtEnv, GrvtWSEndpointType
 from pysdk.grvt_ccxt_utils import rand_uint32
 
+from mpdex.utils.queue_logging import create_file_logger
+
 
 def create_grvt_ws_logger(name: str, filename: str, level=logging.ERROR) -> logging.Logger:
-    os.makedirs("logs", exist_ok=True)
-    logger = logging.getLogger(name)
-    logger.setLevel(level)
-    if not logger.handlers:
-        fh = logging.FileHandler(f"logs/{filename}")
-        fh.setLevel(level)
-        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-        fh.setFormatter(formatter)
-        logger.addHandler(fh)
-    logger.propagate = False
-    return logger
+    return create_file_logger(name, filename, level)
 
 
 class GrvtWSClient:
@@ -56,6 +50,9 @@ class GrvtWSClient:
         - Open orders (via order/state stream)
     """
 
+    CLOSED_ORDERS_MAX = 1000  # closed order status cache size
+    ORDER_WAIT_TIMEOUT = 60.0  # wait_order_closed default (push missed during reconnect is not redelivered)
+
     def __init__(
         self,
         api_key: str,
@@ -75,14 +72,14 @@ class GrvtWSClient:
 
         # Caches
         self._prices: Dict[str, float] = {}  # symbol -> mark_price
-        self._price_ts: Dict[str, float] = {}  # symbol -> timestamp
+        self._price_ts: Dict[str, float] = {}  # symbol -> time.monotonic()
         self._orderbooks: Dict[str, Dict[str, Any]] = {}  # symbol -> orderbook
         self._orderbook_ts: Dict[str, float] = {}
         self._positions: Dict[str, Dict[str, Any]] = {}  # symbol -> position
         self._position_ts: Dict[str, float] = {}
         self._collateral: Optional[Dict[str, Any]] = None
         self._collateral_ts: float = 0
-        self._open_orders: Dict[str, list] = {}  # symbol -> orders
+        self._open_orders: Dict[str, Dict[str, dict]] = {}  # symbol -> {order_id: order}
         self._open_orders_ts: Dict[str, float] = {}
 
         # Subscribed symbols
@@ -94,6 +91,12 @@ class GrvtWSClient:
         # Events for data ready (first data received)
         self._position_event: asyncio.Event = asyncio.Event()
         self._orders_event: asyncio.Event = asyncio.Event()
+        self._price_events: Dict[str, asyncio.Event] = {}  # symbol -> first ticker
+        self._book_events: Dict[str, asyncio.Event] = {}  # symbol -> first orderbook
+
+        # Closed orders (order_id / client_order_id -> final status) and their waiters
+        self._closed_orders: Dict[str, str] = {}
+        self._order_waiters: Dict[str, Set[asyncio.Event]] = {}
 
     @property
     def connected(self) -> bool:
@@ -161,7 +164,8 @@ class GrvtWSClient:
 
             if instrument and mark_price:
                 self._prices[instrument] = float(mark_price)
-                self._price_ts[instrument] = time.time()
+                self._price_ts[instrument] = time.monotonic()
+                self._price_events.setdefault(instrument, asyncio.Event()).set()
         except Exception as e:
             self._logger.error(f"_on_ticker error: {e}")
 
@@ -190,7 +194,8 @@ class GrvtWSClient:
 
             if instrument:
                 self._orderbooks[instrument] = {"bids": bids, "asks": asks}
-                self._orderbook_ts[instrument] = time.time()
+                self._orderbook_ts[instrument] = time.monotonic()
+                self._book_events.setdefault(instrument, asyncio.Event()).set()
 
         except Exception as e:
             self._logger.error(f"_on_orderbook error: {e}")
@@ -223,7 +228,7 @@ class GrvtWSClient:
                     "size": str(size_val),
                     "raw_data": feed
                 }
-            self._position_ts[instrument] = time.time()
+            self._position_ts[instrument] = time.monotonic()
 
             # Mark position data as ready
             if not self._position_event.is_set():
@@ -239,6 +244,8 @@ class GrvtWSClient:
 
             # Extract order info
             order_id = feed.get("order_id")
+            if order_id is not None:
+                order_id = str(order_id)
             legs = feed.get("legs", [])
             state = feed.get("state", {})
             status = state.get("status", "")
@@ -250,9 +257,8 @@ class GrvtWSClient:
             if not instrument:
                 return
 
-            # Initialize order list for symbol if needed
-            if instrument not in self._open_orders:
-                self._open_orders[instrument] = []
+            # Initialize order map for symbol if needed
+            orders = self._open_orders.setdefault(instrument, {})
 
             if status in ("OPEN", "PENDING"):
                 # Add/update order
@@ -264,19 +270,18 @@ class GrvtWSClient:
                     "side": "buy" if legs[0].get("is_buying_asset") else "sell"
                 }
                 # Update or add
-                existing = [o for o in self._open_orders[instrument] if o["id"] == order_id]
+                existing = orders.get(order_id)
                 if existing:
-                    existing[0].update(order_info)
+                    existing.update(order_info)
                 else:
-                    self._open_orders[instrument].append(order_info)
+                    orders[order_id] = order_info
             else:
                 # Remove closed/cancelled/filled order
-                self._open_orders[instrument] = [
-                    o for o in self._open_orders[instrument]
-                    if o.get("id") != order_id
-                ]
+                orders.pop(order_id, None)
+                client_order_id = (feed.get("metadata") or {}).get("client_order_id")
+                self._mark_order_closed(order_id, client_order_id, status)
 
-            self._open_orders_ts[instrument] = time.time()
+            self._open_orders_ts[instrument] = time.monotonic()
 
             # Mark orders data as ready
             if not self._orders_event.is_set():
@@ -285,6 +290,20 @@ class GrvtWSClient:
         except Exception as e:
             self._logger.error(f"_on_order error: {e}")
 
+    def _mark_order_closed(self, order_id: Optional[str], client_order_id: Optional[str], status: str):
+        """Record final status and wake waiters (keyed by both ids)"""
+        for key in (order_id, client_order_id):
+            if not key:
+                continue
+            key = str(key)
+            self._closed_orders[key] = status
+            for event in self._order_waiters.pop(key, ()):
+                event.set()
+
+        # Keep only recent entries
+        while len(self._closed_orders) > self.CLOSED_ORDERS_MAX:
+            self._closed_orders.pop(next(iter(self._closed_orders)))
+
     # ========== Subscribe methods ==========
 
     async def subscribe_ticker(self, symbol: str, rate: str = "500"):
@@ -358,7 +377,8 @@ class GrvtWSClient:
 
     def get_open_orders(self, symbol: str) -> Optional[list]:
         """Get cached open orders"""
-        return self._open_orders.get(symbol)
+        orders = self._open_orders.get(symbol)
+        return list(orders.values()) if orders is not None else None
 
     def get_collateral(self) -> Optional[Dict[str, Any]]:
         """Get cached collateral (not available via WS, always None)"""
@@ -368,23 +388,23 @@ class GrvtWSClient:
 
     def is_price_fresh(self, symbol: str, max_age_sec: float = 5.0) -> bool:
         """Check if cached price is fresh"""
-        ts = self._price_ts.get(symbol, 0)
-        return (time.time() - ts) < max_age_sec
+        ts = self._price_ts.get(symbol)
+        return ts is not None and (time.monotonic() - ts) < max_age_sec
 
     def is_orderbook_fresh(self, symbol: str, max_age_sec: float = 5.0) -> bool:
         """Check if cached orderbook is fresh"""
-        ts = self._orderbook_ts.get(symbol, 0)
-        return (time.time() - ts) < max_age_sec
+        ts = self._orderbook_ts.get(symbol)
+        return ts is not None and (time.monotonic() - ts) < max_age_sec
 
     def is_position_fresh(self, symbol: str, max_age_sec: float = 5.0) -> bool:
         """Check if cached position is fresh"""
-        ts = self._position_ts.get(symbol, 0)
-        return (time.time() - ts) < max_age_sec
+        ts = self._position_ts.get(symbol)
+        return ts is not None and (time.monotonic() - ts) < max_age_sec
 
     def is_orders_fresh(self, symbol: str, max_age_sec: float = 5.0) -> bool:
         """Check if cached orders are fresh"""
-        ts = self._open_orders_ts.get(symbol, 0)
-        return (time.time() - ts) < max_age_sec
+        ts = self._open_orders_ts.get(symbol)
+        return ts is not None and (time.monotonic() - ts) < max_age_sec
 
     # ========== Data ready check ==========
 
@@ -406,6 +426,24 @@ class GrvtWSClient:
         except asyncio.TimeoutError:
             return False
 
+    async def wait_price_ready(self, symbol: str, timeout: float = 5.0) -> bool:
+        """Wait until first ticker for symbol is received"""
+        return await self._wait_event(self._price_events.setdefault(symbol, asyncio.Event()), timeout)
+
+    async def wait_orderbook_ready(self, symbol: str, timeout: float = 5.0) -> bool:
+        """Wait until first orderbook for symbol is received"""
+        return await self._wait_event(self._book_events.setdefault(symbol, asyncio.Event()), timeout)
+
+    @staticmethod
+    async def _wait_event(event: asyncio.Event, timeout: float) -> bool:
+        if event.is_set():
+            return True
+        try:
+            await asyncio.wait_for(event.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
     async def wait_orders_ready(self, timeout: float = 5.0) -> bool:
         """Wait until orders data is available"""
         if self._orders_event.is_set():
@@ -416,6 +454,39 @@ class GrvtWSClient:
         except asyncio.TimeoutError:
             return False
 
+    async def wait_order_closed(self, order_id: str, timeout: Optional[float] = ORDER_WAIT_TIMEOUT) -> Optional[str]:
+        """
+        Wait until order leaves the book (pushed by order stream, no polling).
+        order_id: exchange order_id or client_order_id (create_order return value)
+        Returns final status (FILLED/CANCELLED/REJECTED), None on timeout.
+        timeout=None waits for the push only; a push missed while reconnecting is never delivered.
+        """
+        key = str(order_id)
+        status = self._closed_orders.get(key)
+        if status:
+            return status
+
+        if not self._order_subscribed:
+            await self.subscribe_orders()
+            status = self._closed_orders.get(key)
+            if status:
+                return status
+
+        event = asyncio.Event()
+        self._order_waiters.setdefault(key, set()).add(event)
+        try:
+            await asyncio.wait_for(event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            # timeout/cancel -> drop this waiter so _order_waiters does not grow
+            waiters = self._order_waiters.get(key)
+            if waiters is not None:
+                waiters.discard(event)
+                if not waiters:
+                    del self._order_waiters[key]
+        return self._closed_orders.get(key)
+
     # ========== Trading methods (via WS RPC) ==========
 
     async def create_order(
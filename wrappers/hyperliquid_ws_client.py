@@ -1,10 +1,10 @@
 import asyncio
-import json
 import logging
 from typing import Any, Dict, List, Optional, Tuple
 from websockets.exceptions import ConnectionClosed, ConnectionClosedOK
 
 from wrappers.base_ws_client import BaseWSClient, _json_dumps
+from mpdex.utils.fast_json import json_loads
 
 logger = logging.getLogger(__name__)
 
@@ -637,7 +637,7 @@ class HLWSClientRaw(BaseWSClient):
                 continue
 
             try:
-                msg = json.loads(raw)
+                msg = json_loads(raw)
             except Exception:
                 logger.debug(f"non-json message: {str(raw)[:200]}")
                 continue
@@ -3,11 +3,14 @@ from lighter.signer_client import SignerClient
 from lighter.api.account_api import AccountApi
 from lighter.api.order_api import OrderApi
 import aiohttp
+import asyncio
 import time
 import json
 import logging
 from typing import Optional, Dict, Any
 
+from mpdex.utils.fast_json import json_loads
+
 # [ADDED] WebSocket 클라이언트 풀 import
 from wrappers.lighter_ws_client import LIGHTER_WS_POOL, LighterWSClient
 
@@ -42,6 +45,8 @@ class LighterExchange(MultiPerpDexMixin, MultiPerpDex):
         self._collateral_last_fetch_ts: float = 0.0
         self._collateral_cooldown_sec: float = 0.5
 
+        self._http: Optional[aiohttp.ClientSession] = None
+
         # WebSocket
         self._ws_client: Optional[LighterWSClient] = None
         self._account_id = account_id
@@ -71,17 +76,28 @@ class LighterExchange(MultiPerpDexMixin, MultiPerpDex):
     #async def initialize(self):
     #    await self.client.set_account_index()
 
+    def _session(self) -> aiohttp.ClientSession:
+        # 요청마다 세션을 새로 열지 않고 keep-alive 연결 재사용
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    ttl_dns_cache=300,
+                    enable_cleanup_closed=True,   # 종료 중인 SSL 소켓 정리 보조
+                )
+            )
+        return self._http
+
     async def init(self):
-        async with aiohttp.ClientSession() as session:
-            async with session.get(f"{self.url}/api/v1/orderBooks") as resp:
-                data = await resp.json()
-                for m in data["order_books"]:
-                    self.market_info[m["symbol"].upper()] = {
-                        "market_id": m["market_id"],
-                        "size_decimals": m["supported_size_decimals"],
-                        "price_decimals": m["supported_price_decimals"],
-                        "market_type":m["market_type"], # perp or spot
-                    }
+        session = self._session()
+        async with session.get(f"{self.url}/api/v1/orderBooks") as resp:
+            data = await resp.json(loads=json_loads)
+            for m in data["order_books"]:
+                self.market_info[m["symbol"].upper()] = {
+                    "market_id": m["market_id"],
+                    "size_decimals": m["supported_size_decimals"],
+                    "price_decimals": m["supported_price_decimals"],
+                    "market_type":m["market_type"], # perp or spot
+                }
         
         self.update_available_symbols()
 
@@ -189,6 +205,10 @@ class LighterExchange(MultiPerpDexMixin, MultiPerpDex):
         if self._ws_client:
             await LIGHTER_WS_POOL.release(self._account_id, force_close=force_close)
             self._ws_client = None
+        if self._http and not self._http.closed:
+            await self._http.close()
+            await asyncio.sleep(0.25)  # keep-alive SSL 소켓이 닫힐 시간 (종료 시 경고 방지)
+        self._http = None
         await self.client.close()
     
 
@@ -475,18 +495,18 @@ class LighterExchange(MultiPerpDexMixin, MultiPerpDex):
         url = f"{self.url}/api/v1/account?by=l1_address&value={l1_address}"
         headers = {"accept": "application/json"}
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers) as resp:
-                data = await resp.json()
-                accounts = data['accounts']
-                for account in accounts:
-                    
-                    if account['index'] == self.client.account_index:
-                        positions = account['positions']
-                        for pos in positions:
-                            if pos['symbol'] in symbol:
-                                return self.parse_position(pos)
-                return None
+        session = self._session()
+        async with session.get(url, headers=headers) as resp:
+            data = await resp.json(loads=json_loads)
+            accounts = data['accounts']
+            for account in accounts:
+                
+                if account['index'] == self.client.account_index:
+                    positions = account['positions']
+                    for pos in positions:
+                        if pos['symbol'] in symbol:
+                            return self.parse_position(pos)
+            return None
     
     async def close_position(self, symbol, position, *, is_reduce_only=True):
         return await super().close_position(symbol, position, is_reduce_only=is_reduce_only)
@@ -532,7 +552,7 @@ class LighterExchange(MultiPerpDexMixin, MultiPerpDex):
                 }
             # WS에 대기 후에도 데이터가 없으면 REST fallback
         print("[lighter] get_collateral: using REST fallback")
-        now = time.time()
+        now = time.monotonic()
 
         # 캐시 유효 → 바로 반환
         if (
@@ -547,52 +567,52 @@ class LighterExchange(MultiPerpDexMixin, MultiPerpDex):
         url = f"{self.url}/api/v1/account?by=l1_address&value={l1_address}"
         headers = {"accept": "application/json"}
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers) as resp:
-                data = await resp.json()
-                accounts = data['accounts']
-                for account in accounts:
-                    
-                    if account['index'] == self.client.account_index:
-                        total_collateral = float(account['total_asset_value'])
-                        margin_used = 0
-                        for pos in account['positions']:
-                            position_value = float(pos['position_value'])
-                            initial_margin_fraction = float(pos['initial_margin_fraction'])/100.0
-                            margin_used += position_value*initial_margin_fraction
-                            
-                        available_collateral = float(total_collateral)-margin_used
-
-                        # spot data
-                        assets = account.get('assets',{})
-                        spot = {}
-                        for asset in assets:
-                            symbol = asset.get('symbol',"")
-                            total = float(asset.get('balance',0))
-                            locked = float(asset.get('locked_balance',0))
-                            available = total - locked
-                            
-                            self.spot_balance[symbol] = {'total':total, 
-                                                         'available':available,
-                                                         'locked':locked
-                                                         }
-                            
-                            # spot stable data
-                            if symbol in STABLES:
-                                spot[symbol] = total
-
-                    result = {
-                            "available_collateral": round(available_collateral, 2),
-                            "total_collateral": round(total_collateral, 2),
-                            "spot": spot,
-                        }
-
-                    # 캐시 갱신
-                    self._collateral_cache = result
-                    self._collateral_last_fetch_ts = now
-
-                    return result
+        session = self._session()
+        async with session.get(url, headers=headers) as resp:
+            data = await resp.json(loads=json_loads)
+            accounts = data['accounts']
+            for account in accounts:
                 
+                if account['index'] == self.client.account_index:
+                    total_collateral = float(account['total_asset_value'])
+                    margin_used = 0
+                    for pos in account['positions']:
+                        position_value = float(pos['position_value'])
+                        initial_margin_fraction = float(pos['initial_margin_fraction'])/100.0
+                        margin_used += position_value*initial_margin_fraction
+                        
+                    available_collateral = float(total_collateral)-margin_used
+
+                    # spot data
+                    assets = account.get('assets',{})
+                    spot = {}
+                    for asset in assets:
+                        symbol = asset.get('symbol',"")
+                        total = float(asset.get('balance',0))
+                        locked = float(asset.get('locked_balance',0))
+                        available = total - locked
+                        
+                        self.spot_balance[symbol] = {'total':total, 
+                                                     'available':available,
+                                                     'locked':locked
+                                                     }
+                        
+                        # spot stable data
+                        if symbol in STABLES:
+                            spot[symbol] = total
+
+                result = {
+                        "available_collateral": round(available_collateral, 2),
+                        "total_collateral": round(total_collateral, 2),
+                        "spot": spot,
+                    }
+
+                # 캐시 갱신
+                self._collateral_cache = result
+                self._collateral_last_fetch_ts = now
+
+                return result
+            
         # 해당 계정 못 찾음 → 빈 결과(캐시 안 함)
         return {
             "available_collateral": 0.0,
@@ -16,13 +16,13 @@ WS URL: wss://mainnet.zklighter.elliot.ai/stream
     # 이후 get_mark_price(), get_position(), get_collateral() 등 사용
 """
 import asyncio
-import json
 import logging
 import time
 from typing import Any, Dict, List, Optional
 from websockets.exceptions import ConnectionClosed, ConnectionClosedOK
 
 from wrappers.base_ws_client import BaseWSClient, _json_dumps
+from mpdex.utils.fast_json import json_loads
 
 logger = logging.getLogger(__name__)
 
@@ -279,7 +279,7 @@ class LighterWSClient(BaseWSClient):
                 continue
 
             try:
-                msg = json.loads(raw)
+                msg = json_loads(raw)
             except Exception:
                 continue
 
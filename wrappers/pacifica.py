@@ -1,5 +1,7 @@
 from multi_perp_dex import MultiPerpDexMixin, MultiPerpDex
 from mpdex.utils.common_pacifica import sign_message
+from mpdex.utils.fast_json import json_loads
+import asyncio
 import time
 import uuid
 import requests
@@ -74,7 +76,7 @@ class PacificaExchange(MultiPerpDexMixin, MultiPerpDex):
         if self._http is None or self._http.closed:
             self._http = aiohttp.ClientSession(
                 connector=TCPConnector(
-                    force_close=True,             # 매 요청 후 소켓 닫기 → 종료 시 잔여 소켓 최소화
+                    ttl_dns_cache=300,            # keep-alive 연결 재사용 (정리는 close() 에서)
                     enable_cleanup_closed=True,   # 종료 중인 SSL 소켓 정리 보조 (로그 억제)
                 )
             )
@@ -89,6 +91,7 @@ class PacificaExchange(MultiPerpDexMixin, MultiPerpDex):
         """
         if self._http and not self._http.closed:
             await self._http.close()
+            await asyncio.sleep(0.25)  # keep-alive SSL 소켓이 닫힐 시간 (종료 시 경고 방지)
         if self.ws_client:
             from .pacifica_ws_client import PACIFICA_WS_POOL
             await PACIFICA_WS_POOL.release(self.public_key, force_close=force_close)
@@ -108,7 +111,7 @@ class PacificaExchange(MultiPerpDexMixin, MultiPerpDex):
         s = self._session()
         async with s.get(url) as r:
             r.raise_for_status()
-            data = await r.json()
+            data = await r.json(loads=json_loads)
 
         # 기대 형태: {"success": true, "data": [ {symbol, tick_size, lot_size, ...}, ... ]}
         items = data.get("data") or []
@@ -292,7 +295,7 @@ class PacificaExchange(MultiPerpDexMixin, MultiPerpDex):
         url = f"{BASE_URL}/account/leverage"
         s = self._session()
         async with s.post(url, json=payload, headers={"Content-Type": "application/json"}) as r:
-            return await r.json()
+            return await r.json(loads=json_loads)
 
     async def create_order(self, symbol, side, amount, price=None, order_type='market', *, is_reduce_only=False, slippage = "0.1"):
         """
@@ -402,7 +405,7 @@ class PacificaExchange(MultiPerpDexMixin, MultiPerpDex):
         s = self._session()
         async with s.post(req_url, json=request, headers=headers) as r:
             try:
-                data = await r.json()
+                data = await r.json(loads=json_loads)
             except aiohttp.ContentTypeError:
                 data = await r.text()
 
@@ -472,7 +475,7 @@ class PacificaExchange(MultiPerpDexMixin, MultiPerpDex):
 
         async with s.get(url, params=params) as r:
             r.raise_for_status()
-            data = await r.json()
+            data = await r.json(loads=json_loads)
 
         data = data.get('data',{})
         for pos in data:
@@ -516,7 +519,7 @@ class PacificaExchange(MultiPerpDexMixin, MultiPerpDex):
         params = {"account":self.public_key}
         async with s.get(url, params=params) as r:
             r.raise_for_status()
-            data = await r.json()
+            data = await r.json(loads=json_loads)
 
         data = data.get('data',{})
 
@@ -579,7 +582,7 @@ class PacificaExchange(MultiPerpDexMixin, MultiPerpDex):
 
         async with s.get(url, params=params) as r:
             r.raise_for_status()
-            data = await r.json()
+            data = await r.json(loads=json_loads)
 
         data = data.get('data',{})
         results = []
@@ -690,7 +693,7 @@ class PacificaExchange(MultiPerpDexMixin, MultiPerpDex):
             s = self._session()
             async with s.post(req_url, json=request, headers=headers) as r:
                 try:
-                    data = await r.json()
+                    data = await r.json(loads=json_loads)
                 except aiohttp.ContentTypeError:
                     data = await r.text()
             try:
@@ -714,7 +717,7 @@ class PacificaExchange(MultiPerpDexMixin, MultiPerpDex):
         s = self._session()
         async with s.get(url) as r:
             r.raise_for_status()
-            data = await r.json()
+            data = await r.json(loads=json_loads)
 
         items = data.get("data") or []
         ts_now = int(time.time() * 1000)
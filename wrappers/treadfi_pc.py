@@ -99,7 +99,7 @@ class TreadfiPcExchange(MultiPerpDexMixin, MultiPerpDex):
 		if self._http is None or self._http.closed:
 			self._http = aiohttp.ClientSession(
 				connector=TCPConnector(
-					force_close=True,
+					ttl_dns_cache=300,  # keep-alive 연결 재사용 (정리는 close() 에서)
 					enable_cleanup_closed=True,
 				)
 			)
@@ -114,6 +114,7 @@ class TreadfiPcExchange(MultiPerpDexMixin, MultiPerpDex):
 		"""
 		if self._http and not self._http.closed:
 			await self._http.close()
+			await asyncio.sleep(0.25)  # keep-alive SSL 소켓이 닫힐 시간 (종료 시 경고 방지)
 		if self.ws_client:
 			from .pacifica_ws_client import PACIFICA_WS_POOL
 			await PACIFICA_WS_POOL.release(
@@ -1,4 +1,4 @@
-from multi_perp_dex import MultiPerpDex, MultiPerpDexMixin
+from multi_perp_dex import MultiPerpDex, MultiPerpDexMixin, close_order_side
 import asyncio
 from typing import Optional, Dict, Any, List, Tuple
 import os
@@ -7,6 +7,7 @@ from pathlib import Path
 from curl_cffi import requests as curl_requests
 from eth_utils import to_checksum_address
 from .variational_auth import VariationalAuth
+from mpdex.utils.fast_json import json_loads
 import time
 
 BASE_URL = "https://omni.variational.io"
@@ -239,10 +240,16 @@ class VariationalExchange(MultiPerpDexMixin, MultiPerpDex):
         self.options.setdefault("probe_qty", "0.0001") # any qty is ok
         self.options.setdefault("max_slippage", 0.01)  # 1%
         self.options.setdefault("min_price_refresh_ms", 500)  # 최소 
+        self.options.setdefault("min_collateral_refresh_ms", 1000)  # get_collateral 캐시 유지 시간 (주문/취소 시 무효화)
         self.options.setdefault("auto_login_on_demand", True)  # 자동 로그인 허용 플래그
         self.options.setdefault("funding_interval_s", 3600) # 3600 으로 강제됨, 처음 받는 response와 달리 항시 3600
+        self.options.setdefault("max_quote_age_s", 3.0) # prepare_market_order 로 받아둔 quote 재사용 한도
+        self.options.setdefault("keepalive_s", None) # 설정 시 N초 이상 유휴면 가벼운 GET 으로 연결 유지
         self._impersonate = self.options.get("impersonate", "chrome")
         self._timeout = float(self.options.get("timeout", 10.0))
+        self._http: Optional[curl_requests.AsyncSession] = None # 요청 간 재사용(keep-alive)
+        self._last_activity: float = 0.0
+        self._keepalive_task: Optional[asyncio.Task] = None
         self.session_cookies = session_cookies
         # 로그인 도우미
         self._auth = VariationalAuth(wallet_address=self.address, evm_private_key=self._pk, session_cookies=self.session_cookies)
@@ -262,10 +269,40 @@ class VariationalExchange(MultiPerpDexMixin, MultiPerpDex):
         self._session_ready: bool = False
         self._vr_token: Optional[str] = None  # 메모리 보관
         self._last_viewed_coin: str = "BTC"  # referer용 기본 코인 (get_orderbook 호출 시 업데이트)
+        self._collateral_cache: Optional[Tuple[int, Dict[str, Any]]] = None  # (monotonic ms, get_collateral 결과)
+        self._collateral_inflight: Optional[asyncio.Task] = None  # 진행 중인 조회 (동시 호출 공유)
+        self._price_inflight: Dict[str, asyncio.Task] = {}  # coin -> 진행 중인 가격 조회 (동시 호출 공유)
 
     def get_perp_quote(self, symbol, *, is_basic_coll=False):
         return 'USD'
 
+    def _session(self) -> curl_requests.AsyncSession:
+        if self._http is None:
+            self._http = curl_requests.AsyncSession(impersonate=self._impersonate, timeout=self._timeout)
+        keepalive_s = self.options.get("keepalive_s")
+        if keepalive_s and self._keepalive_task is None:
+            self._keepalive_task = asyncio.create_task(self._keepalive_loop(float(keepalive_s)))
+        return self._http
+
+    async def _keepalive_loop(self, interval: float):
+        """유휴 interval 초 이상이면 collateral 조회로 TCP/TLS 연결이 끊기지 않게 유지"""
+        try:
+            while True:
+                if not self._initialized:
+                    # login 전에는 보낼 요청이 없음 -> interval 단위로만 확인
+                    await asyncio.sleep(interval)
+                    continue
+                idle = time.monotonic() - self._last_activity
+                if idle >= interval:
+                    try:
+                        await self._get_collateral_raw()
+                    except Exception:
+                        pass
+                    idle = 0.0
+                await asyncio.sleep(max(0.5, interval - idle))
+        except asyncio.CancelledError:
+            pass
+
     async def _probe_cookie_valid(self, vr_token: str) -> bool:
         if not vr_token:
             return False
@@ -277,9 +314,9 @@ class VariationalExchange(MultiPerpDexMixin, MultiPerpDex):
             "vr-connected-address": self.address,
         }
         cookies = {"vr-token": vr_token}
-        async with curl_requests.AsyncSession(impersonate=self._impersonate, timeout=self._timeout) as s:
-            r = await s.get(url, headers=headers, cookies=cookies)
-            return int(r.status_code) == 200
+        # 공용 세션 사용 → 로그인 확인이 곧 연결 warm-up (첫 주문에서 TLS handshake 생략)
+        r = await self._session().get(url, headers=headers, cookies=cookies)
+        return int(r.status_code) == 200
 
     async def login(
         self,
@@ -432,21 +469,22 @@ class VariationalExchange(MultiPerpDexMixin, MultiPerpDex):
     async def _request(self, method: str, path: str, *, params=None, json_body=None, coin: Optional[str] = None) -> Any:
         headers, cookies = await self._headers_and_cookies(coin=coin)
         url = BASE_URL + path
-        async with curl_requests.AsyncSession(impersonate=self._impersonate, timeout=self._timeout) as s:
-            if method.upper() == "GET":
-                r = await s.get(url, params=params, headers=headers, cookies=cookies)
-            elif method.upper() == "POST":
-                r = await s.post(url, json=json_body, headers=headers, cookies=cookies)
-            elif method.upper() == "PUT":
-                r = await s.put(url, json=json_body, headers=headers, cookies=cookies)
-            else:
-                r = await s.request(method.upper(), url, params=params, json=json_body, headers=headers, cookies=cookies)
-            r.raise_for_status()
-            ct = (r.headers or {}).get("content-type", "")
-            try:
-                return r.json() if "application/json" in ct else r.text
-            except Exception:
-                return r.text
+        s = self._session()
+        self._last_activity = time.monotonic()
+        if method.upper() == "GET":
+            r = await s.get(url, params=params, headers=headers, cookies=cookies)
+        elif method.upper() == "POST":
+            r = await s.post(url, json=json_body, headers=headers, cookies=cookies)
+        elif method.upper() == "PUT":
+            r = await s.put(url, json=json_body, headers=headers, cookies=cookies)
+        else:
+            r = await s.request(method.upper(), url, params=params, json=json_body, headers=headers, cookies=cookies)
+        r.raise_for_status()
+        ct = (r.headers or {}).get("content-type", "")
+        try:
+            return json_loads(r.content) if "application/json" in ct else r.text
+        except Exception:
+            return r.text
     
     # ---------------------------
     # 내부: 런타임 캐시 유틸
@@ -591,7 +629,10 @@ class VariationalExchange(MultiPerpDexMixin, MultiPerpDex):
             raise ValueError("quote_id가 비어있습니다.")
         method, path = ENDPOINTS["create_market_order"]
         payload = {"quote_id": quote_id, "side": side.lower(), "max_slippage": max_slippage, "is_reduce_only": is_reduce_only}
-        return await self._request(method, path, json_body=payload, coin=coin)
+        try:
+            return await self._request(method, path, json_body=payload, coin=coin)
+        finally:
+            self._invalidate_collateral()
 
     async def _create_limit_order(
         self,
@@ -616,7 +657,10 @@ class VariationalExchange(MultiPerpDexMixin, MultiPerpDex):
             "use_mark_price": bool(use_mark_price),
             "is_reduce_only": bool(is_reduce_only),
         }
-        return await self._request(method, path, json_body=payload, coin=coin)
+        try:
+            return await self._request(method, path, json_body=payload, coin=coin)
+        finally:
+            self._invalidate_collateral()
     
     async def _fetch_positions_all(self):
         method, path = ENDPOINTS["fetch_position"]
@@ -630,7 +674,10 @@ class VariationalExchange(MultiPerpDexMixin, MultiPerpDex):
         if not rfq_id:
             return False
         method, path = ENDPOINTS["cancel_order"]
-        resp = await self._request(method, path, json_body={"rfq_id": rfq_id})
+        try:
+            resp = await self._request(method, path, json_body={"rfq_id": rfq_id})
+        finally:
+            self._invalidate_collateral()
         # 취소 응답이 비어있을 수 있음 → status 200이면 True로 간주
         return True if resp is not None else True
 
@@ -678,12 +725,7 @@ class VariationalExchange(MultiPerpDexMixin, MultiPerpDex):
         # 강제 갱신 또는 캐시 부재 → 시도
         if force_refresh or (not cached or cached.get("mark_price") is None):
             try:
-                core = await self._fetch_indicative_quote(coin=coin, qty=probe_qty, funding_interval_s=funding)
-                
-                price = core.get("mark_price")
-                # [ADDED] 성공 시 타임스탬프 갱신(만약 내부에서 갱신 못했을 경우 보강)
-                self._rt_cache.setdefault(coin, {}).update({"mark_price": price, "last_price_at_ms": now_ms})
-                return price
+                return await self._refresh_price(coin, probe_qty, funding)
             except Exception:
                 # 실패 시 캐시 fallback
                 if cached and (cached.get("mark_price") is not None):
@@ -696,12 +738,32 @@ class VariationalExchange(MultiPerpDexMixin, MultiPerpDex):
 
         # 캐시도 없으면 최후 시도
         try:
-            core = await self._fetch_indicative_quote(coin=coin, qty=probe_qty, funding_interval_s=funding)
-            price = core.get("mark_price")
-            self._rt_cache.setdefault(coin, {}).update({"mark_price": price, "last_price_at_ms": now_ms})
-            return price
+            return await self._refresh_price(coin, probe_qty, funding)
         except Exception:
             return None
+
+    async def _refresh_price(self, coin: str, qty, funding: int) -> Optional[float]:
+        """
+        coin 별 single-flight: 동시에 들어온 가격 조회는 진행 중인 indicative quote 1건을 공유
+        """
+        task = self._price_inflight.get(coin)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_mark_price(coin, qty, funding))
+            self._price_inflight[coin] = task
+            task.add_done_callback(lambda t: self._clear_price_inflight(coin, t))
+        return await asyncio.shield(task)
+
+    async def _fetch_mark_price(self, coin: str, qty, funding: int) -> Optional[float]:
+        started_ms = int(time.monotonic() * 1000)
+        core = await self._fetch_indicative_quote(coin=coin, qty=qty, funding_interval_s=funding)
+        price = core.get("mark_price")
+        # [ADDED] 성공 시 타임스탬프 갱신(만약 내부에서 갱신 못했을 경우 보강)
+        self._rt_cache.setdefault(coin, {}).update({"mark_price": price, "last_price_at_ms": started_ms})
+        return price
+
+    def _clear_price_inflight(self, coin: str, task: asyncio.Task):
+        if self._price_inflight.get(coin) is task:
+            del self._price_inflight[coin]
     
     async def create_order(self, symbol, side, amount, price=None, order_type="market", *, is_reduce_only=False):
         """
@@ -737,20 +799,56 @@ class VariationalExchange(MultiPerpDexMixin, MultiPerpDex):
             return res.get('rfq_id')
 
         # market: 최신 quote_id 필요
+        prepared = await self.prepare_market_order(coin, side, amount)
+        return await self.send_prepared_order(prepared)
+
+    async def prepare_market_order(self, symbol, side, amount) -> Dict[str, Any]:
+        """
+        market 주문 사전 준비: indicative quote(quote_id)까지만 받아두고 전송은 send_prepared_order.
+        헤지처럼 트리거 시점에 요청 1회로 바로 보내야 할 때 미리 호출해 둔다.
+        """
+        await self.initialize_if_needed()
+        coin = str(symbol).upper()
+        side = (side or "buy").lower()
+        self._last_viewed_coin = coin
+
         cached = self._rt_cache.get(coin)
         funding = int((cached or {}).get("funding_interval_s") or self.options.get("funding_interval_s", 3600))
         core = await self._fetch_indicative_quote(coin=coin, qty=str(amount), funding_interval_s=funding)
         quote_id = core.get("quote_id")
         if not quote_id:
             raise RuntimeError("quote_id를 얻지 못했습니다. indicative quote 실패.")
-        
-        res = await self._create_market_order(
-            coin=coin,
-            side=side,
-            quote_id=quote_id,
+        return {"coin": coin, "side": side, "amount": amount, "quote_id": quote_id, "quoted_at": time.monotonic()}
+
+    async def prepare_close_position(self, symbol, position=None) -> Optional[Dict[str, Any]]:
+        """
+        close_position 사전 준비 (포지션 반대 방향 market quote). 포지션 없으면 None.
+        send_prepared_order 로 전송.
+        """
+        if position is None:
+            position = await self.get_position(symbol)
+        if not position or position.get('side') == 'flat':
+            return None
+        side = close_order_side(position.get('side'))
+        return await self.prepare_market_order(symbol, side, position.get('size'))
+
+    async def send_prepared_order(self, prepared: Dict[str, Any]):
+        """
+        prepare_market_order 결과 전송 → rfq_id.
+        quote가 max_quote_age_s 보다 오래됐으면 재발급 후 전송.
+        전송은 shield 처리 (호출측 취소로 헤지 주문이 중간에 끊기지 않도록).
+        """
+        max_age = float(self.options.get("max_quote_age_s", 3.0))
+        if time.monotonic() - prepared["quoted_at"] > max_age:
+            prepared = await self.prepare_market_order(prepared["coin"], prepared["side"], prepared["amount"])
+
+        res = await asyncio.shield(self._create_market_order(
+            coin=prepared["coin"],
+            side=prepared["side"],
+            quote_id=prepared["quote_id"],
             max_slippage=float(self.options.get("max_slippage", 0.01)),
             #is_reduce_only=bool(self.options.get("reduce_only", False)),
-        )
+        ))
         return res.get('rfq_id')
     
     async def get_position(self, symbol):
@@ -761,16 +859,46 @@ class VariationalExchange(MultiPerpDexMixin, MultiPerpDex):
     
     async def get_collateral(self):
         await self.initialize_if_needed()
+
+        # throttle: 마지막 조회 후 min_collateral_refresh_ms 이내면 캐시 반환
+        now_ms = int(time.monotonic() * 1000)
+        thresh_ms = int(self.options.get("min_collateral_refresh_ms", 0) or 0)
+        if self._collateral_cache and (now_ms - self._collateral_cache[0]) < thresh_ms:
+            return dict(self._collateral_cache[1])
+
+        # single-flight: 동시에 들어온 호출은 진행 중인 조회 1건을 공유
+        task = self._collateral_inflight
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_collateral())
+            self._collateral_inflight = task
+            task.add_done_callback(self._clear_collateral_inflight)
+        return dict(await asyncio.shield(task))
+
+    async def _fetch_collateral(self) -> Dict[str, Any]:
+        started_ms = int(time.monotonic() * 1000)
         data = await self._get_collateral_raw()
         if isinstance(data, str):
             try:
                 data = json.loads(data)
             except Exception:
                 return {"total_collateral": None, "available_collateral": None}
-        return {
+        res = {
             "total_collateral": data.get("balance"),
             "available_collateral": data.get("max_withdrawable_amount"),
         }
+        # 조회 도중 주문/취소로 무효화됐으면 캐시에 넣지 않음
+        if self._collateral_inflight is asyncio.current_task():
+            self._collateral_cache = (started_ms, res)
+        return res
+
+    def _clear_collateral_inflight(self, task: asyncio.Task):
+        if self._collateral_inflight is task:
+            self._collateral_inflight = None
+
+    def _invalidate_collateral(self):
+        """주문/취소 후 호출: 캐시와 진행 중 조회 공유를 끊음 (다음 호출은 새로 조회)"""
+        self._collateral_cache = None
+        self._collateral_inflight = None
     
     async def get_open_orders(self, symbol):
         return await self.fetch_open_orders(symbol)
@@ -874,5 +1002,17 @@ class VariationalExchange(MultiPerpDexMixin, MultiPerpDex):
         return await super().close_position(symbol, position, is_reduce_only=is_reduce_only)
 
     async def close(self):
-        """No persistent session to close"""
-        pass
\ No newline at end of file
+        """Close pooled HTTP session"""
+        if self._keepalive_task is not None:
+            self._keepalive_task.cancel()
+            try:
+                await self._keepalive_task
+            except asyncio.CancelledError:
+                pass
+            self._keepalive_task = None
+        if self._http is not None:
+            try:
+                await self._http.close()
+            except Exception:
+                pass
+            self._http = None